@@ -1,16 +1,18 @@
 import streamlit as st
-import tempfile
+import hashlib
+import math
+import os
 import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Dict, Any, List, Tuple, Optional
-import pandas as pd
 from io import BytesIO
-import copy
 import time
 
-# Import parser modules
-from bilancio_parser import BilancioParser
-from excel_exporter import ExcelExporter
+# Only the lightweight configuration loader is imported eagerly: pandas and
+# the parser modules (which pull in pdfplumber and openpyxl) are imported
+# lazily at their use sites so the first paint of the page does not pay
+# their import cost. After the first use they are free via sys.modules.
 from configuration_manager import ConfigurationManager
 
 # Configure logging for Streamlit
@@ -21,26 +23,32 @@ logging.basicConfig(
 )
 
 # Load configuration at module level
-def load_app_config():
-    """Load configuration for Streamlit app"""
+def _resolve_config_path() -> Optional[Path]:
+    """Resolve the configuration path once (modular dir first, then legacy file)"""
     current_dir = Path.cwd()
     config_dir = current_dir / 'config'
     config_file = current_dir / 'config.yaml'
-    
+
     if config_dir.exists() and any(config_dir.glob('config_*.yaml')):
-        config_path = config_dir
-    elif config_file.exists():
-        config_path = config_file
-    else:
+        return config_dir
+    if config_file.exists():
+        return config_file
+    return None
+
+def load_app_config():
+    """Load configuration for Streamlit app"""
+    if CONFIG_PATH is None:
         return {}
-    
+
     try:
-        config_manager = ConfigurationManager(config_path)
+        config_manager = ConfigurationManager(CONFIG_PATH)
         return config_manager.get_full_config()
     except:
         return {}
 
-# Load config once
+# Resolve the config path and load the config once; per-rerun code reads
+# these constants instead of re-globbing the config directory
+CONFIG_PATH = _resolve_config_path()
 APP_CONFIG = load_app_config()
 
 # Configure page
@@ -52,8 +60,12 @@ st.set_page_config(
 )
 
 # Modern CSS styling with red-grey palette
-def inject_custom_css():
-    st.markdown("""
+# The stylesheet is a compile-time constant; keeping it at module scope
+# means each rerun re-sends the same interned string instead of building
+# a fresh 5 KB literal inside the function. It must still be injected on
+# every rerun — elements not re-emitted disappear from the page, so a
+# one-shot session guard would drop the styling after the first rerun.
+_CUSTOM_CSS = """
     <style>
     /* Import Google Fonts */
     @import url('https://fonts.googleapis.com/css2?family=Inter:wght@300;400;500;600;700&display=swap');
@@ -417,7 +429,23 @@ def inject_custom_css():
         }
     }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+def inject_custom_css():
+    st.markdown(_CUSTOM_CSS, unsafe_allow_html=True)
+
+@st.cache_resource
+def _get_parser(config_path_str: str) -> "BilancioParser":
+    """Construct the parser once per Streamlit process and share it"""
+    from bilancio_parser import BilancioParser
+    return BilancioParser(Path(config_path_str))
+
+@st.cache_resource
+def _get_reclassifier(config_path_str: str) -> Tuple["FinancialReclassifier", bool]:
+    """Construct the reclassifier once and pre-validate its configuration"""
+    from financial_reclassifier import FinancialReclassifier
+    reclassifier = FinancialReclassifier(Path(config_path_str))
+    return reclassifier, reclassifier.validate_configuration()
 
 def init_session_state():
     """Initialize session state variables"""
@@ -436,12 +464,30 @@ def init_session_state():
         st.session_state.brsf_scale = streamlit_config.get('brsf_scale_default')
     if 'parser' not in st.session_state:
         st.session_state.parser = None
-    if 'exporter' not in st.session_state:
-        st.session_state.exporter = None
+    if 'reclassifier' not in st.session_state:
+        st.session_state.reclassifier = None
+    if 'reclassifier_valid' not in st.session_state:
+        st.session_state.reclassifier_valid = False
     if 'selected_document' not in st.session_state:
         st.session_state.selected_document = None
     if 'uploaded_files_hash' not in st.session_state:
         st.session_state.uploaded_files_hash = None
+    if '_apply_cache' not in st.session_state:
+        st.session_state._apply_cache = {}
+    if '_flatten_cache' not in st.session_state:
+        st.session_state._flatten_cache = {}
+    if '_header_cache' not in st.session_state:
+        st.session_state._header_cache = {}
+    if '_rollup_cache' not in st.session_state:
+        st.session_state._rollup_cache = {}
+    if '_excel_cache' not in st.session_state:
+        st.session_state._excel_cache = {}
+    if '_excel_futures' not in st.session_state:
+        st.session_state._excel_futures = {}
+    if '_card_labels' not in st.session_state:
+        st.session_state._card_labels = {}
+    if '_brsf_cache' not in st.session_state:
+        st.session_state._brsf_cache = {}
 
 def ensure_temp_directory():
     """Ensure temp_bilanci directory exists"""
@@ -453,48 +499,54 @@ def cleanup_temp_files():
     """Clean up all files in temp_bilanci directory"""
     temp_dir = Path.cwd() / 'temp_bilanci'
     if temp_dir.exists():
-        for file_path in temp_dir.glob('*'):
-            try:
-                if file_path.is_file():
-                    file_path.unlink()
-            except Exception as e:
-                logging.warning(f"Could not delete {file_path}: {e}")
+        # os.scandir reuses the directory entry's cached file type, so
+        # each file costs one unlink instead of an extra stat via pathlib
+        with os.scandir(temp_dir) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file(follow_symlinks=False):
+                        os.unlink(entry.path)
+                except OSError as e:
+                    logging.warning(f"Could not delete {entry.path}: {e}")
 
 def setup_parser():
-    """Initialize parser and exporter if not already done"""
+    """Initialize parser and reclassifier if not already done"""
     if st.session_state.parser is None:
         try:
-            # Look for configuration
-            current_dir = Path.cwd()
-            config_dir = current_dir / 'config'
-            config_file = current_dir / 'config.yaml'
-            
-            if config_dir.exists() and any(config_dir.glob('config_*.yaml')):
-                config_path = config_dir
-            elif config_file.exists():
-                config_path = config_file
-            else:
+            # Configuration path is resolved once at import
+            if CONFIG_PATH is None:
                 st.error("Configuration not found. Please ensure 'config' directory or 'config.yaml' file exists.")
                 return False
-            
-            st.session_state.parser = BilancioParser(config_path)
-            st.session_state.exporter = ExcelExporter()
+
+            # The factories are st.cache_resource-backed, so every session
+            # of this Streamlit process shares one parser/reclassifier
+            # instead of re-reading the configs per session
+            st.session_state.parser = _get_parser(str(CONFIG_PATH))
+            st.session_state.reclassifier, st.session_state.reclassifier_valid = \
+                _get_reclassifier(str(CONFIG_PATH))
             return True
         except Exception as e:
             st.error(f"Failed to initialize parser: {str(e)}")
             return False
     return True
 
+# Shared read-only sentinel for absent nested dicts: `d.get(key) or EMPTY`
+# avoids allocating a fresh empty dict on every `.get(key, {})` call in the
+# status helpers, which run for every card and BRSF redraw. Never hand EMPTY
+# to anything that might mutate it.
+EMPTY: Dict[str, Any] = {}
+
 def get_document_status(result: Dict[str, Any]) -> str:
     """Get document processing status"""
     if not result:
         return "FAILED"
-    
-    parser_status = result.get('validazioni', {}).get('summary', {}).get('status', 'failed')
-    reclassification_data = result.get('reclassification', {})
-    
+
+    validazioni = result.get('validazioni') or EMPTY
+    parser_status = (validazioni.get('summary') or EMPTY).get('status', 'failed')
+    reclassification_data = result.get('reclassification') or EMPTY
+
     if reclassification_data.get('success', False):
-        balance_validation = reclassification_data.get('balance_sheet_validation', {})
+        balance_validation = reclassification_data.get('balance_sheet_validation') or EMPTY
         reclassify_status = balance_validation.get('status', 'success')
         
         if parser_status == 'failed' or reclassify_status == 'failed':
@@ -516,8 +568,8 @@ def get_document_type(result: Dict[str, Any]) -> str:
     if not result:
         return "Unknown"
     
-    metadata = result.get('metadata', {})
-    
+    metadata = result.get('metadata') or EMPTY
+
     # Check for consolidated format first
     if metadata.get('is_consolidated_format', False):
         return "Consolidated"
@@ -527,16 +579,16 @@ def get_document_type(result: Dict[str, Any]) -> str:
     
     if is_abbreviated:
         # Check if it was enriched from Nota Integrativa
-        sp = result.get('stato_patrimoniale', {})
+        sp = result.get('stato_patrimoniale') or EMPTY
         if sp:
-            attivo = sp.get('attivo', {})
-            crediti = attivo.get('II - Crediti', {})
-            
+            attivo = sp.get('attivo') or EMPTY
+            crediti = attivo.get('II - Crediti') or EMPTY
+
             if crediti and crediti.get('enriched_from_ni', False):
                 return "Abbreviated with Notes"
-        
+
         # Check for orphan voices (also indicates NI enrichment)
-        reclassification = result.get('reclassification', {})
+        reclassification = result.get('reclassification') or EMPTY
         if reclassification.get('success') and reclassification.get('orphan_voices_count', 0) > 0:
             return "Abbreviated with Notes"
         
@@ -562,6 +614,23 @@ def get_document_year(result: Dict[str, Any]) -> str:
     except:
         return full_date
 
+def get_document_header(result: Dict[str, Any]) -> Tuple[str, str, str]:
+    """Get (status, year, type) for a parsed result, cached per tree
+
+    Parsed results are immutable once stored in session state, so the
+    nested dict probes in the getters above only need to run once per
+    document instead of on every rerun.
+    """
+    cache = st.session_state._header_cache
+    cache_key = id(result)
+    header = cache.get(cache_key)
+    if header is None:
+        header = (get_document_status(result),
+                  get_document_year(result),
+                  get_document_type(result))
+        cache[cache_key] = header
+    return header
+
 def create_modern_header():
     """Create modern header"""
     st.markdown("""
@@ -570,15 +639,12 @@ def create_modern_header():
     </div>
     """, unsafe_allow_html=True)
 
-def create_about_section():
-    """Create collapsible about section"""
-    with st.expander("📋 About FinancialLens", expanded=False):
-        st.markdown("""
+# Fully static about text, hoisted to module scope and emitted as a single
+# st.markdown call: one frontend element per rerun instead of seven
+_ABOUT_MARKDOWN = """
         This tool parses **Italian standalone financial statements** in **PDF format**, extracting structured data for further analysis. It is designed for financial statements that meet all of the following technical and legal requirements:
-        """)
-        
-        st.markdown("#### 📄 Supported Documents")
-        st.markdown("""
+
+        #### 📄 Supported Documents
         - **Type**: Italian Standalone or Consolidated OIC annual financial statements
         - **Format**: PDF with **digitally selectable text** (not scanned images)
         - **Layout**:
@@ -589,35 +655,32 @@ def create_about_section():
             - two numeric columns (typically current year and previous year)
             - no merged cells or embedded images
           - Structure based on **Italian Civil Code schema**
-        """)
-        
-        st.markdown("#### 📊 Supported Filing Types")
-        st.markdown("""
+
+        #### 📊 Supported Filing Types
         This parser currently supports the following statement formats (Only OIC):
-        - **"Bilancio Consolidato"**                    
+        - **"Bilancio Consolidato"**
         - **"Bilancio esteso"**
         - **"Bilancio abbreviato"** – abbreviated format (Art. 2435-bis)
         - **"Bilancio abbreviato con dettaglio in Nota Integrativa"** – summary format with receivables and payables detailed in the Notes section
-        """)
-        
-        st.markdown("#### 🧪 Experimental Compatibility")
-        st.markdown("""
+
+        #### 🧪 Experimental Compatibility
         Preliminary or interim financial statements may be compatible **if** they follow the same structure and nomenclature, but they are **not officially supported or tested** yet.
-        """)
-        
-        st.markdown("#### ❌ Unsupported Documents")
-        st.markdown("""
-        - IAS/IFRS   
+
+        #### ❌ Unsupported Documents
+        - IAS/IFRS
         - Custom or reformatted layouts
         - Scanned PDFs or image-based files (no OCR support)
         - PDFs with non-standard structure, merged cells, or visual formatting anomalies
-        """)
-        
-        st.markdown("#### ⚠️ Important Notes")
-        st.markdown("""
+
+        #### ⚠️ Important Notes
         - This is a **BETA version**: parsing errors or inconsistencies may occur. **Manual review is strongly recommended!**
         - The parser relies on the **standard Italian XBRL taxonomy** for label recognition.
-        """)
+        """
+
+def create_about_section():
+    """Create collapsible about section"""
+    with st.expander("📋 About FinancialLens", expanded=False):
+        st.markdown(_ABOUT_MARKDOWN)
 
 def create_upload_section():
     """Create upload section with dynamic state"""
@@ -661,24 +724,47 @@ def check_file_changes(uploaded_files):
     """Check if uploaded files have changed and reset state if needed"""
     current_files_hash = None
     if uploaded_files:
-        current_files_hash = hash(tuple(f.name + str(f.size) for f in uploaded_files))
-    
-    previous_hash = st.session_state.get('uploaded_files_hash', None)
-    
-    if current_files_hash != previous_hash:
-        # Reset all relevant session state
-        st.session_state.parsing_results = {}
-        st.session_state.user_modifications = {}
-        st.session_state.selected_document = None
-        st.session_state.view_mode = "view"
-        st.session_state.uploaded_files_hash = current_files_hash
-        
-        # Clean up temp files when files change
-        cleanup_temp_files()
-        
-        return True  # Files changed
-    
-    return False  # No change
+        # blake2b gives a stable digest: the builtin hash() is randomized
+        # per interpreter and f.name + str(f.size) concatenations can
+        # collide across renames
+        digest = hashlib.blake2b(digest_size=16)
+        for f in uploaded_files:
+            digest.update(f.name.encode())
+            digest.update(f.size.to_bytes(8, 'little'))
+        current_files_hash = digest.hexdigest()
+    
+    # This runs on every rerun while files are present; the common no-change
+    # case should cost nothing beyond the hash comparison
+    if current_files_hash == st.session_state.get('uploaded_files_hash', None):
+        return False  # No change
+
+    # Reset all relevant session state
+    st.session_state.parsing_results = {}
+    st.session_state.user_modifications = {}
+    st.session_state.selected_document = None
+    st.session_state.view_mode = "view"
+    st.session_state.uploaded_files_hash = current_files_hash
+
+    # Clean up temp files when files change
+    cleanup_temp_files()
+
+    return True  # Files changed
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _parse_pdf_cached(pdf_bytes: bytes, config_path_str: str) -> Optional[Dict[str, Any]]:
+    """Parse a PDF from its raw bytes, memoized on content
+
+    Parser output is deterministic for identical input, so re-uploading an
+    already-seen file (common while iterating on edits) is a cache hit
+    instead of a multi-second parse. Each cache miss builds its own parser
+    instance: loading the configuration is cheap next to the parse, and it
+    keeps the function safe to call from the parsing worker threads.
+    """
+    # The parser accepts file-like objects, so the upload is parsed
+    # straight from memory: no temp file, no cleanup, no disk I/O
+    from bilancio_parser import BilancioParser
+    parser = BilancioParser(Path(config_path_str))
+    return parser.parse(BytesIO(pdf_bytes))
 
 def process_uploaded_files(uploaded_files):
     """Process uploaded PDF files with progress indicators"""
@@ -695,7 +781,14 @@ def process_uploaded_files(uploaded_files):
     # Clear previous results
     st.session_state.parsing_results = {}
     st.session_state.user_modifications = {}
-    
+    st.session_state._apply_cache = {}
+    st.session_state._flatten_cache = {}
+    st.session_state._header_cache = {}
+    st.session_state._rollup_cache = {}
+    st.session_state._excel_cache = {}
+    st.session_state._excel_futures = {}
+    st.session_state._brsf_cache = {}
+
     # Create progress placeholder that will be completely cleared
     progress_placeholder = st.empty()
     
@@ -703,54 +796,66 @@ def process_uploaded_files(uploaded_files):
         st.markdown("### 🔄 Processing Financial Statements")
         
         progress_bar = st.progress(0)
-        status_text = st.empty()
-        
-        temp_files_created = []
-        
-        for i, uploaded_file in enumerate(uploaded_files):
-            filename = uploaded_file.name
-            status_text.markdown(f"**Processing:** `{filename}`")
-            
-            # Save uploaded file to temp directory
-            temp_file_path = temp_dir / f"{filename}_{int(time.time())}.pdf"
-            temp_files_created.append(temp_file_path)
-            
-            try:
-                # Write file to temp directory
-                with open(temp_file_path, 'wb') as f:
-                    f.write(uploaded_file.getvalue())
-                
-                # Parse the file
-                result = st.session_state.parser.parse(temp_file_path)
-                
-                if result:
-                    st.session_state.parsing_results[filename] = result
-                    st.session_state.user_modifications[filename] = {}
-                    status_text.markdown(f"**✅ Completed:** `{filename}`")
-                else:
-                    status_text.markdown(f"**❌ Failed:** `{filename}`")
-                
-            except Exception as e:
-                st.error(f"Error processing {filename}: {str(e)}")
-            
-            # Update progress
-            progress_bar.progress((i + 1) / len(uploaded_files))
-            time.sleep(0.5)
-        
-        # Clean up temporary files
-        for temp_file_path in temp_files_created:
-            try:
-                if temp_file_path.exists():
-                    temp_file_path.unlink()
-            except Exception as e:
-                logging.warning(f"Could not delete {temp_file_path}: {e}")
-        
-        status_text.markdown("**🎉 Processing Complete!**")
-        time.sleep(1)
-    
-    # Clear the progress container completely and force refresh
+
+        def _parse_one(uploaded_file):
+            """Parse the upload through the content-keyed parse cache"""
+            # The raw bytes double as the cache key, so re-uploading an
+            # already-parsed PDF is a cache hit instead of a full parse
+            uploaded_file.seek(0)
+            return _parse_pdf_cached(uploaded_file.getvalue(), str(CONFIG_PATH))
+
+        # Parse files concurrently: the GIL is released during PDF library
+        # C calls and disk I/O, so wall time approaches the slowest file
+        # instead of the sum of all files. Streamlit calls stay on this
+        # thread; workers only write temp files and run the parser. A
+        # process pool would sidestep the GIL for the pure-Python parts
+        # too, but each worker would have to reload the YAML config and
+        # the reclassification mapping workbook per upload batch, which
+        # costs more than it saves for a handful of files.
+        completed = 0
+        max_workers = min(len(uploaded_files), os.cpu_count() or 4, 5)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(_parse_one, uploaded_file): uploaded_file.name
+                for uploaded_file in uploaded_files
+            }
+
+            for future in as_completed(futures):
+                filename = futures[future]
+                outcome = "❌ Failed"
+
+                try:
+                    result = future.result()
+
+                    if result:
+                        st.session_state.parsing_results[filename] = result
+                        st.session_state.user_modifications[filename] = {}
+                        outcome = "✅ Completed"
+
+                except Exception as e:
+                    st.error(f"Error processing {filename}: {str(e)}")
+
+                # One widget update per completed file: the status rides on
+                # the progress bar text instead of a second frontend push
+                completed += 1
+                progress_bar.progress(
+                    completed / len(uploaded_files),
+                    text=f"{outcome} ({completed}/{len(uploaded_files)}): {filename}"
+                )
+
+        # Precompute the truncated card labels once per batch; the card
+        # grid re-renders on every rerun and only needs a dict lookup
+        st.session_state._card_labels = {
+            filename: f"📄 {filename[:20]}{'...' if len(filename) > 20 else ''}"
+            for filename in st.session_state.parsing_results
+        }
+
+    # Clear the progress container and fall through: main() renders the
+    # cards and BRSF right after this returns, since parsing_results is
+    # already populated, so no explicit rerun is needed. The completion
+    # notice goes through st.toast, which doesn't block the script
     progress_placeholder.empty()
-    st.rerun()
+    st.toast("🎉 Processing complete!")
 
 def create_document_cards(successful_results):
     """Create document cards with selection indicators"""
@@ -768,29 +873,19 @@ def create_document_cards(successful_results):
         col = cols[idx % 3]
         
         with col:
-            status = get_document_status(result)
-            year = get_document_year(result)
-            doc_type = get_document_type(result)
+            status, year, doc_type = get_document_header(result)
             
             # Check if this document is selected
             is_selected = st.session_state.selected_document == filename
             
-            # Status styling
-            if status == "SUCCESS":
-                status_class = "status-success"
-                status_icon = "✅"
-            elif status == "SUCCESS_WITH_TOLERANCE":
-                status_class = "status-warning"
-                status_icon = "⚠️"
-            else:
-                status_class = "status-error"
-                status_icon = "❌"
-            
+            # Status styling via table lookup
+            _, status_icon, status_text, status_color = STATUS_STYLES.get(status, STATUS_STYLES['FAILED'])
+
             # Create button with selection state
             button_style = "primary" if is_selected else "secondary"
             
             if st.button(
-                f"📄 {filename[:20]}{'...' if len(filename) > 20 else ''}",
+                st.session_state._card_labels.get(filename, f"📄 {filename[:20]}"),
                 key=f"doc_card_{idx}",
                 type=button_style,
                 use_container_width=True
@@ -798,28 +893,21 @@ def create_document_cards(successful_results):
                 st.session_state.selected_document = filename
                 st.rerun()
             
-            # Card content with selection styling
-            card_class = "selected" if is_selected else ""
-            st.markdown(f"""
-            <div class="document-card {card_class}" style="margin-top: -0.5rem; padding: 0.5rem; background: white; border-radius: 8px; border: 1px solid #E2E8F0;">
-                <div class="{status_class}" style="display: inline-block; margin-bottom: 0.5rem;">
-                    {status_icon} {status.replace('_', ' ').title()}
-                </div>
-                <div style="font-size: 0.875rem; color: var(--primary-grey);">
-                    <strong>Year:</strong> {year}<br>
-                    <strong>Type:</strong> {doc_type}
-                </div>
-            </div>
-            """, unsafe_allow_html=True)
+            # Card content as native components: Streamlit diffs these
+            # against the previous run instead of reshipping and
+            # re-parsing a raw HTML block per card per rerun
+            with st.container(border=True):
+                st.markdown(f":{status_color}[{status_icon} {status_text}]")
+                st.caption(f"**Year:** {year}  \n**Type:** {doc_type}")
 
 def get_balance_sheet_error(result: Dict[str, Any]) -> Tuple[float, str]:
     """Calculate balance sheet error and determine status color"""
-    reclassification = result.get('reclassification', {})
-    
+    reclassification = result.get('reclassification') or EMPTY
+
     if not reclassification.get('success'):
         return 0.0, "success"
-    
-    balance_validation = reclassification.get('balance_sheet_validation', {})
+
+    balance_validation = reclassification.get('balance_sheet_validation') or EMPTY
     difference = balance_validation.get('difference', 0.0)
     status = balance_validation.get('status', 'success')
     
@@ -833,53 +921,115 @@ def get_balance_sheet_error(result: Dict[str, Any]) -> Tuple[float, str]:
     
     return difference, color_class
 
+# Constant BRSF display structures, hoisted to module scope so they are
+# built once instead of on every rerun
+
+# Calculated/derived items
+CALCULATED_ITEMS = frozenset({
+    'Cost of Sales', 'S G & A', 'PRE TAX PROFIT', 'PROFIT AFTER TAX',
+    'Quick Assets', 'Other Current', 'Financial/Other fix Ass', 'BAL. SHEET TOT',
+    'Total Short Term Debt', 'Sub. Loan/Oth. LT', 'Liabs less net worth',
+    'TOT NET WORTH'
+})
+
+# Section structures with spacing
+SECTION_STRUCTURES = {
+    'P&L': (
+        'Total Sales', 'Cost of Sales', 'GROSS PROFIT', 'S G & A', 'NET OP. PROFIT',
+        'Interest Received', 'Interest Paid', 'Other Income/Expense', 'PRE TAX PROFIT',
+        'Taxation', 'PROFIT AFTER TAX', '', '', '', 'Deprecation'  # Three empty rows before Deprecation
+    ),
+    'ASSETS': (
+        'Cash & Equivalent', 'Trade Debtors', 'Quick Assets', 'Stock & Work in Progr.',
+        'Other Current', 'TOT CURR. ASS.', 'Tangible Fxed Assets', 'Intangibles',
+        'Goodwill', 'Financial/Other fix Ass', 'TOTAL FIX. ASS.', 'BAL. SHEET TOT',
+        '', '', 'Balance Sheet Err'  # Two empty rows before Balance Sheet Error
+    ),
+    'LIABILITIES': (
+        'Overdrafts & STD', 'Current Portion LTD', 'Total Short Term Debt', 'Trade Creditors',
+        'Other Current', 'TOT CURR. LIAB.', 'Total Long Term Debt', 'Provisions',
+        'Sub. Loan/Oth. LT', 'TOTAL LT LIAB', 'Liabs less net worth', 'Share Holders Funds',
+        "Ret'd Earnings/Resv's", 'TOT NET WORTH', 'BAL. SHEET TOT'
+    )
+}
+
+# Items that can never be edited directly, even without children
+NEVER_EDITABLE_ITEMS = frozenset({'II - Crediti', 'D) Debiti'})
+
+# Per-status display styling: CSS class, icon, display text, markdown color
+STATUS_STYLES = {
+    'SUCCESS': ('status-success', '✅', 'Success', 'green'),
+    'SUCCESS_WITH_TOLERANCE': ('status-warning', '⚠️', 'Success With Tolerance', 'orange'),
+    'FAILED': ('status-error', '❌', 'Failed', 'red')
+}
+
+# Per-row CSS strings and the Styler table spec for the BRSF tables, built
+# once at import instead of re-allocated per section per render
+_BRSF_EMPTY_STYLE = 'background-color: transparent; color: transparent; border: none;'
+_BRSF_CALC_STYLE = 'background-color: #4A5568; color: white; font-weight: bold;'
+_BRSF_REGULAR_STYLE = 'background-color: white; color: #2D3748;'
+_BRSF_ERROR_STYLES = {
+    'balance-error-success': 'background-color: #C6F6D5; color: #22543D; font-weight: bold;',
+    'balance-error-warning': 'background-color: #FEEBC8; color: #C05621; font-weight: bold;',
+    'balance-error-error': 'background-color: #FED7D7; color: #C53030; font-weight: bold;'
+}
+_BRSF_TABLE_STYLES = [
+    {
+        'selector': 'thead th',
+        'props': [
+            ('background-color', '#F7FAFC'),
+            ('color', '#2D3748'),
+            ('font-weight', 'bold'),
+            ('text-align', 'center'),
+            ('padding', '10px'),
+            ('border', '1px solid #E2E8F0')
+        ]
+    },
+    {
+        'selector': 'tbody td',
+        'props': [
+            ('padding', '8px'),
+            ('border', '1px solid #E2E8F0'),
+            ('text-align', 'left')
+        ]
+    },
+    {
+        'selector': 'tbody td:nth-child(2)',
+        'props': [
+            ('text-align', 'right')
+        ]
+    }
+]
+
 def display_brsf_table(result: Dict[str, Any], filename: str):
     """Display BRSF table"""
+    import pandas as pd
+
     # Get current data with user modifications applied
     current_result = apply_user_modifications(result, filename)
     reclassification = current_result.get('reclassification', {})
-    
+
     if not reclassification.get('success'):
         st.warning("🔍 BRSF data not available - reclassification failed or not performed")
         return
-    
+
     scale_factor = 1000 if st.session_state.brsf_scale == "/1000" else 1
     scale_label = " (thousands €)" if scale_factor == 1000 else " (€)"
-    
+
     reclassified_data = reclassification.get('reclassified_data', {})
-    
-    # Define calculated/derived items
-    calculated_items = {
-        'Cost of Sales', 'S G & A', 'PRE TAX PROFIT', 'PROFIT AFTER TAX',
-        'Quick Assets', 'Other Current', 'Financial/Other fix Ass', 'BAL. SHEET TOT',
-        'Total Short Term Debt', 'Sub. Loan/Oth. LT', 'Liabs less net worth',
-        'TOT NET WORTH'
-    }
-    
-    # Define section structures with spacing
-    section_structures = {
-        'P&L': [
-            'Total Sales', 'Cost of Sales', 'GROSS PROFIT', 'S G & A', 'NET OP. PROFIT',
-            'Interest Received', 'Interest Paid', 'Other Income/Expense', 'PRE TAX PROFIT',
-            'Taxation', 'PROFIT AFTER TAX', '', '', '', 'Deprecation'  # Three empty rows before Deprecation
-        ],
-        'ASSETS': [
-            'Cash & Equivalent', 'Trade Debtors', 'Quick Assets', 'Stock & Work in Progr.',
-            'Other Current', 'TOT CURR. ASS.', 'Tangible Fxed Assets', 'Intangibles',
-            'Goodwill', 'Financial/Other fix Ass', 'TOTAL FIX. ASS.', 'BAL. SHEET TOT',
-            '', '', 'Balance Sheet Err'  # Two empty rows before Balance Sheet Error
-        ],
-        'LIABILITIES': [
-            'Overdrafts & STD', 'Current Portion LTD', 'Total Short Term Debt', 'Trade Creditors',
-            'Other Current', 'TOT CURR. LIAB.', 'Total Long Term Debt', 'Provisions',
-            'Sub. Loan/Oth. LT', 'TOTAL LT LIAB', 'Liabs less net worth', 'Share Holders Funds',
-            "Ret'd Earnings/Resv's", 'TOT NET WORTH', 'BAL. SHEET TOT'
-        ]
-    }
-    
+
     # Get balance sheet error for Assets section
     bs_error, error_color_class = get_balance_sheet_error(current_result)
-    
+
+    # The section DataFrames only change when the edits or the display scale
+    # change; unrelated reruns (tab switches, button clicks) reuse the cached
+    # frames instead of re-scaling and re-formatting every cell
+    frames_key = (
+        _modifications_cache_key(filename, st.session_state.user_modifications.get(filename, {})),
+        scale_factor
+    )
+    section_frames = st.session_state._brsf_cache.setdefault(frames_key, {})
+
     # Create columns for the three sections
     col1, col2, col3 = st.columns(3)
     columns = [col1, col2, col3]
@@ -901,187 +1051,224 @@ def display_brsf_table(result: Dict[str, Any], filename: str):
             ">{section}</div>
             """, unsafe_allow_html=True)
             
-            section_data = reclassified_data.get(section, {})
-            section_structure = section_structures.get(section, [])
-            
-            # Create DataFrame
-            data_rows = []
-            for item in section_structure:
-                if item == '':
-                    # Empty row
-                    data_rows.append({
-                        'Item': '',
-                        f'Value{scale_label}': '',
-                        'IsCalculated': False,
-                        'IsEmpty': True,
-                        'IsBalanceError': False
-                    })
-                elif item == 'Balance Sheet Err':
-                    # Balance sheet error row
-                    scaled_error = bs_error / scale_factor if scale_factor > 1 else bs_error
-                    if scale_factor == 1000:
-                        formatted_error = f"{round(scaled_error):,}"
-                    else:
-                        formatted_error = f"{scaled_error:,.2f}"
-                    
-                    data_rows.append({
-                        'Item': 'Balance Sheet Err',
-                        f'Value{scale_label}': formatted_error,
-                        'IsCalculated': False,
-                        'IsEmpty': False,
-                        'IsBalanceError': True,
-                        'ErrorColorClass': error_color_class
-                    })
-                else:
-                    # Regular item
-                    value = section_data.get(item, 0.0)
-                    scaled_value = value / scale_factor if scale_factor > 1 else value
-                    
-                    if scale_factor == 1000:
-                        formatted_value = f"{round(scaled_value):,}"
-                    else:
-                        formatted_value = f"{scaled_value:,.2f}"
-                    
-                    data_rows.append({
-                        'Item': item,
-                        f'Value{scale_label}': formatted_value,
-                        'IsCalculated': item in calculated_items,
-                        'IsEmpty': False,
-                        'IsBalanceError': False
-                    })
-            
-            df = pd.DataFrame(data_rows)
-            
-            # Display without internal columns
-            display_df = df[['Item', f'Value{scale_label}']].copy()
-            
-            # Apply styling
-            def highlight_rows(row):
-                styles = ['', '']
-                row_index = row.name
-                
-                if df.loc[row_index, 'IsEmpty']:
-                    # Empty row - transparent
-                    empty_style = 'background-color: transparent; color: transparent; border: none;'
-                    styles = [empty_style, empty_style]
-                elif df.loc[row_index, 'IsBalanceError']:
-                    # Balance sheet error row with color
-                    error_class = df.loc[row_index, 'ErrorColorClass']
-                    if error_class == 'balance-error-success':
-                        error_style = 'background-color: #C6F6D5; color: #22543D; font-weight: bold;'
-                    elif error_class == 'balance-error-warning':
-                        error_style = 'background-color: #FEEBC8; color: #C05621; font-weight: bold;'
+            cached_frames = section_frames.get(section)
+            if cached_frames is not None:
+                display_df, style_frame = cached_frames
+            else:
+                section_data = reclassified_data.get(section, {})
+                section_structure = SECTION_STRUCTURES.get(section, ())
+
+                # Build display rows and their style strings in a single pass,
+                # instead of carrying flag columns and re-reading them with
+                # per-row .loc lookups in a styling callback
+                error_style = _BRSF_ERROR_STYLES.get(
+                    error_color_class, _BRSF_ERROR_STYLES['balance-error-error']
+                )
+
+                data_rows = []
+                row_styles = []
+                for item in section_structure:
+                    if item == '':
+                        # Empty row - transparent
+                        data_rows.append({'Item': '', f'Value{scale_label}': ''})
+                        row_styles.append(_BRSF_EMPTY_STYLE)
+                    elif item == 'Balance Sheet Err':
+                        # Balance sheet error row
+                        scaled_error = bs_error / scale_factor if scale_factor > 1 else bs_error
+                        if scale_factor == 1000:
+                            formatted_error = f"{round(scaled_error):,}"
+                        else:
+                            formatted_error = f"{scaled_error:,.2f}"
+
+                        data_rows.append({'Item': 'Balance Sheet Err', f'Value{scale_label}': formatted_error})
+                        row_styles.append(error_style)
                     else:
-                        error_style = 'background-color: #FED7D7; color: #C53030; font-weight: bold;'
-                    styles = [error_style, error_style]
-                elif df.loc[row_index, 'IsCalculated']:
-                    # Calculated rows
-                    calculated_style = 'background-color: #4A5568; color: white; font-weight: bold;'
-                    styles = [calculated_style, calculated_style]
-                else:
-                    # Regular rows
-                    regular_style = 'background-color: white; color: #2D3748;'
-                    styles = [regular_style, regular_style]
-                
-                return styles
-            
-            styled_df = display_df.style.apply(highlight_rows, axis=1)
+                        # Regular item
+                        value = section_data.get(item, 0.0)
+                        scaled_value = value / scale_factor if scale_factor > 1 else value
+
+                        if scale_factor == 1000:
+                            formatted_value = f"{round(scaled_value):,}"
+                        else:
+                            formatted_value = f"{scaled_value:,.2f}"
+
+                        data_rows.append({'Item': item, f'Value{scale_label}': formatted_value})
+                        if item in CALCULATED_ITEMS:
+                            row_styles.append(_BRSF_CALC_STYLE)
+                        else:
+                            row_styles.append(_BRSF_REGULAR_STYLE)
+
+                display_df = pd.DataFrame(data_rows)
+                style_frame = pd.DataFrame({'Item': row_styles, f'Value{scale_label}': row_styles})
+                section_frames[section] = (display_df, style_frame)
+
+            # One vectorized styling pass over the precomputed style strings
+            styled_df = display_df.style.apply(lambda _: style_frame, axis=None)
             
             # Additional table styling
-            styled_df = styled_df.set_table_styles([
-                {
-                    'selector': 'thead th',
-                    'props': [
-                        ('background-color', '#F7FAFC'),
-                        ('color', '#2D3748'),
-                        ('font-weight', 'bold'),
-                        ('text-align', 'center'),
-                        ('padding', '10px'),
-                        ('border', '1px solid #E2E8F0')
-                    ]
-                },
-                {
-                    'selector': 'tbody td',
-                    'props': [
-                        ('padding', '8px'),
-                        ('border', '1px solid #E2E8F0'),
-                        ('text-align', 'left')
-                    ]
-                },
-                {
-                    'selector': 'tbody td:nth-child(2)',
-                    'props': [
-                        ('text-align', 'right')
-                    ]
-                }
-            ])
+            styled_df = styled_df.set_table_styles(_BRSF_TABLE_STYLES)
             
             # Display the dataframe
             st.dataframe(styled_df, use_container_width=True, hide_index=True, height=565)
 
 def flatten_financial_data(data: Dict[str, Any], parent_key: str = '', level: int = 0) -> List[Dict[str, Any]]:
     """Flatten hierarchical financial data for editing"""
+    # Both display sections re-flatten on every rerun; trees are cached in
+    # session state and immutable between edits, so memoize per tree object
+    cache = st.session_state.get('_flatten_cache')
+    if cache is not None:
+        cached = cache.get(id(data))
+        if cached is not None:
+            return cached
+
     items = []
-    
-    for key, value in data.items():
-        if isinstance(value, dict) and 'voce_canonica' in value:
-            item = {
-                'key': key,
-                'voce_canonica': value.get('voce_canonica', key),
-                'voce_originale': value.get('voce_originale', ''),
-                'valore': value.get('valore', 0.0),
-                'level': level,
-                'has_children': 'dettaglio' in value and value['dettaglio'],
-                'from_ni': value.get('from_ni', False),
-                'enriched_from_ni': value.get('enriched_from_ni', False),
-                'parent_key': parent_key
-            }
-            items.append(item)
-            
-            # Recursively add children
-            if 'dettaglio' in value and value['dettaglio']:
-                children = flatten_financial_data(value['dettaglio'], key, level + 1)
-                items.extend(children)
-    
+
+    # Iterative depth-first walk; entries are pushed in reverse so the
+    # output order matches the original recursive traversal
+    stack = [
+        (key, value, parent_key, level)
+        for key, value in reversed(list(data.items()))
+    ]
+    while stack:
+        key, value, parent, item_level = stack.pop()
+        if not (isinstance(value, dict) and 'voce_canonica' in value):
+            continue
+
+        has_children = 'dettaglio' in value and value['dettaglio']
+        items.append({
+            'key': key,
+            'voce_canonica': value.get('voce_canonica', key),
+            'voce_originale': value.get('voce_originale', ''),
+            'valore': value.get('valore', 0.0),
+            'level': item_level,
+            'has_children': has_children,
+            'from_ni': value.get('from_ni', False),
+            'enriched_from_ni': value.get('enriched_from_ni', False),
+            'parent_key': parent
+        })
+
+        if has_children:
+            stack.extend(
+                (child_key, child_value, key, item_level + 1)
+                for child_key, child_value in reversed(list(value['dettaglio'].items()))
+            )
+
+    if cache is not None:
+        cache[id(data)] = items
+
     return items
 
+def _clone_tree(node: Dict[str, Any]) -> Dict[str, Any]:
+    """Recursively clone a nested dict tree; leaf values are immutable and safe to alias"""
+    return {
+        key: _clone_tree(value) if isinstance(value, dict) else value
+        for key, value in node.items()
+    }
+
+def _index_tree(node: Dict[str, Any], index: Dict[str, Tuple[Dict[str, Any], Tuple]],
+                ancestors: Tuple = ()) -> None:
+    """Build a flat key -> (node, ancestor path) index for a financial data tree
+
+    The ancestor path is a root-to-parent tuple of (canonical name, node)
+    pairs, so an edit can update just the totals along its own path.
+    """
+    for key, item in node.items():
+        if isinstance(item, dict):
+            index[key] = (item, ancestors)
+            if item.get('dettaglio'):
+                _index_tree(item['dettaglio'], index, ancestors + ((key, item),))
+
+def _propagate_edit(validator, ancestors: Tuple, section_root: Dict[str, Any]) -> None:
+    """Recompute the totals along one root-to-leaf path after an edit
+
+    Walks the edited leaf's ancestors bottom-up and recomputes each total
+    from its (already updated) children with the validator's special rules.
+    This is O(depth) per edit instead of a full tree walk.
+    """
+    for idx in range(len(ancestors) - 1, -1, -1):
+        canonical_name, node = ancestors[idx]
+
+        # NI-enriched totals are authoritative, so the edit stops here and
+        # nothing above can change (mirrors _recursive_recalculate_node)
+        if node.get('enriched_from_ni', False):
+            return
+
+        children_sum = sum(
+            child.get('valore', 0.0)
+            for child in node['dettaglio'].values()
+        )
+        calculated_value = validator._calculate_special_totals(node, canonical_name, children_sum)
+
+        # Special case: A) Patrimonio netto includes the sibling
+        # "Patrimonio netto di terzi" (same rule as the validator)
+        if canonical_name == 'A) Patrimonio netto':
+            parent_map = ancestors[idx - 1][1]['dettaglio'] if idx > 0 else section_root
+            patrimonio_terzi = parent_map.get('Patrimonio netto di terzi', {}).get('valore', 0.0)
+            if patrimonio_terzi != 0.0:
+                calculated_value += patrimonio_terzi
+
+        node['valore'] = calculated_value
+
+def _recalculate_patrimonio_netto(validator, parent_map: Dict[str, Any]) -> None:
+    """Refresh "A) Patrimonio netto" after its terzi sibling changes
+
+    "Patrimonio netto di terzi" is a root-level leaf on consolidated
+    statements, so editing it walks no ancestors and _propagate_edit never
+    touches the sibling total it feeds into. Recompute it here with the
+    same children-sum-plus-terzi rule as _recursive_recalculate_node.
+    """
+    pn_node = parent_map.get('A) Patrimonio netto')
+    if pn_node is None or pn_node.get('enriched_from_ni', False):
+        return
+
+    children_sum = sum(
+        child.get('valore', 0.0)
+        for child in pn_node.get('dettaglio', {}).values()
+    )
+    calculated_value = validator._calculate_special_totals(
+        pn_node, 'A) Patrimonio netto', children_sum)
+
+    patrimonio_terzi = parent_map.get('Patrimonio netto di terzi', {}).get('valore', 0.0)
+    if patrimonio_terzi != 0.0:
+        calculated_value += patrimonio_terzi
+
+    pn_node['valore'] = calculated_value
+
+def _modifications_cache_key(filename: str, user_mods: Dict[str, Any]) -> Tuple:
+    """Build a stable, hashable cache key from the user modifications dict"""
+    return (filename, tuple(sorted(
+        (section_key, tuple(sorted(mods.items())))
+        for section_key, mods in user_mods.items()
+    )))
+
 def apply_user_modifications(result: Dict[str, Any], filename: str) -> Dict[str, Any]:
     """Apply user modifications to result data"""
     if filename not in st.session_state.user_modifications:
         return result
-    
-    modified_result = copy.deepcopy(result)
+
     user_mods = st.session_state.user_modifications[filename]
-    
-    def update_nested_value(data_dict: Dict[str, Any], item_key: str, new_value: float):
-        """Update value in nested dictionary structure"""
-        for key, item in data_dict.items():
-            if key == item_key and isinstance(item, dict):
-                item['valore'] = new_value
-                return True
-            elif isinstance(item, dict) and 'dettaglio' in item:
-                if update_nested_value(item['dettaglio'], item_key, new_value):
-                    return True
-        return False
-    
-    # Apply modifications to each section
-    for section_key, modifications in user_mods.items():
-        if section_key == "conto_economico":
-            ce_data = modified_result.get('conto_economico', {})
-            for item_key, new_value in modifications.items():
-                update_nested_value(ce_data, item_key, new_value)
-                
-        elif section_key == "stato_patrimoniale_attivo":
-            sp_data = modified_result.get('stato_patrimoniale', {})
-            attivo_data = sp_data.get('attivo', {})
-            for item_key, new_value in modifications.items():
-                update_nested_value(attivo_data, item_key, new_value)
-                
-        elif section_key == "stato_patrimoniale_passivo":
-            sp_data = modified_result.get('stato_patrimoniale', {})
-            passivo_data = sp_data.get('passivo', {})
-            for item_key, new_value in modifications.items():
-                update_nested_value(passivo_data, item_key, new_value)
+
+    # The key is initialized to {} in process_uploaded_files, so first render
+    # and edit-free reruns land here: no edits means nothing to recalculate
+    if not user_mods:
+        return result
+
+    # Both display_brsf_table and display_financial_statements call this on
+    # every rerun; memoize on the modifications so unchanged edits (scale
+    # toggles, tab switches) don't repeat the deepcopy + reclassification
+    cache = st.session_state._apply_cache
+    cache_key = _modifications_cache_key(filename, user_mods)
+    if cache_key in cache:
+        return cache[cache_key]
+
+    # Only the financial statement subtrees are mutated by the edits and the
+    # totals recalculation; everything else (metadata, validazioni, raw
+    # texts) can be shared with the original result by reference
+    modified_result = dict(result)
+    if 'conto_economico' in result:
+        modified_result['conto_economico'] = _clone_tree(result['conto_economico'])
+    if 'stato_patrimoniale' in result:
+        modified_result['stato_patrimoniale'] = _clone_tree(result['stato_patrimoniale'])
     
     from data_validator import DataValidator
     validator_config = {'validation_settings': {
@@ -1090,47 +1277,54 @@ def apply_user_modifications(result: Dict[str, Any], filename: str) -> Dict[str,
         'immediate_success_threshold': 2.0
     }}
     validator = DataValidator(validator_config)
-    validator._recursive_recalculate_totals(modified_result)
-    
+
+    # Apply modifications to each section via a flat key -> node index, so
+    # each edited key is an O(1) lookup instead of a full tree search, and
+    # recompute only the totals on each edit's root-to-leaf path instead
+    # of re-walking the whole tree
+    for section_key, modifications in user_mods.items():
+        if section_key == "conto_economico":
+            section_data = modified_result.get('conto_economico', {})
+        elif section_key == "stato_patrimoniale_attivo":
+            section_data = modified_result.get('stato_patrimoniale', {}).get('attivo', {})
+        elif section_key == "stato_patrimoniale_passivo":
+            section_data = modified_result.get('stato_patrimoniale', {}).get('passivo', {})
+        else:
+            continue
+
+        index: Dict[str, Tuple[Dict[str, Any], Tuple]] = {}
+        _index_tree(section_data, index)
+
+        for item_key, new_value in modifications.items():
+            entry = index.get(item_key)
+            if entry is not None:
+                node, ancestors = entry
+                node['valore'] = new_value
+                _propagate_edit(validator, ancestors, section_data)
+
+                # Editing the terzi leaf itself bypasses the path walk (it
+                # has no ancestors), but its value is folded into the
+                # sibling "A) Patrimonio netto" total
+                if item_key == 'Patrimonio netto di terzi':
+                    _recalculate_patrimonio_netto(validator, section_data)
+
     # Recalculate BRSF data with modified values
     modified_result = recalculate_brsf(modified_result)
-    
+
+    cache[cache_key] = modified_result
     return modified_result
 
 def recalculate_brsf(modified_result: Dict[str, Any]) -> Dict[str, Any]:
-    """Recalculate BRSF data using FinancialReclassifier with modified values"""
+    """Recalculate BRSF data using the cached FinancialReclassifier with modified values"""
     try:
-        from financial_reclassifier import FinancialReclassifier
-        from data_validator import DataValidator
-        
-        # Initialize the reclassifier with config path
-        current_dir = Path.cwd()
-        config_dir = current_dir / 'config'
-        config_file = current_dir / 'config.yaml'
-        
-        if config_dir.exists() and any(config_dir.glob('config_*.yaml')):
-            config_path = config_dir
-        elif config_file.exists():
-            config_path = config_file
-        else:
+        # Use the reclassifier instance created once in setup_parser
+        reclassifier = st.session_state.get('reclassifier')
+        if reclassifier is None or not st.session_state.get('reclassifier_valid', False):
             return modified_result
-        
-        # Recalculate totals with special rules using DataValidator
-        validator_config = {'validation_settings': {
-            'tolerance_percentage': 0.01,
-            'tolerance_minimum': 2.0,
-            'immediate_success_threshold': 2.0
-        }}
-        validator = DataValidator(validator_config)
-        validator._recursive_recalculate_totals(modified_result)
-        
-        # Create reclassifier instance
-        reclassifier = FinancialReclassifier(config_path)
-        
-        # Validate reclassifier configuration
-        if not reclassifier.validate_configuration():
-            return modified_result
-        
+
+        # Totals are already up to date: apply_user_modifications recomputes
+        # them along each edit path before calling this
+
         # Use reclassifier to process modified data
         reclassification_result = reclassifier.reclassify_financial_data(modified_result)
         
@@ -1145,7 +1339,11 @@ def recalculate_brsf(modified_result: Dict[str, Any]) -> Dict[str, Any]:
             }
         else:
             if 'reclassification' in modified_result:
-                modified_result['reclassification']['success'] = False
+                # Replace rather than mutate: the dict may be shared with the
+                # original parser result
+                modified_result['reclassification'] = {
+                    **modified_result['reclassification'], 'success': False
+                }
         
         return modified_result
         
@@ -1154,31 +1352,51 @@ def recalculate_brsf(modified_result: Dict[str, Any]) -> Dict[str, Any]:
         return modified_result
 
 def recalculate_totals(data: Dict[str, Any]):
-    """Recalculate parent totals from children"""
-    def recalc_node(node):
-        if isinstance(node, dict) and 'dettaglio' in node and node['dettaglio']:
-            # First recalculate all children
-            for child in node['dettaglio'].values():
-                recalc_node(child)
-            
-            # Don't recalculate if enriched from NI
-            if not node.get('enriched_from_ni', False):
-                # Calculate sum of children
-                children_sum = sum(
-                    child.get('valore', 0.0) 
-                    for child in node['dettaglio'].values()
-                    if isinstance(child, dict)
-                )
-                
-                # Update parent value
-                if children_sum != 0 or node.get('valore', 0.0) == 0:
-                    node['valore'] = children_sum
-    
-    # Recalculate for each top-level section
-    for section_data in data.values():
-        if isinstance(section_data, dict):
-            for item in section_data.values():
-                recalc_node(item)
+    """Recalculate parent totals from children in a single post-order pass"""
+    # The tree structure never changes between edits (only 'valore' does),
+    # so the post-order parent schedule is materialized once per tree and
+    # reused: repeated roll-ups only do the float sums
+    cache = st.session_state.get('_rollup_cache')
+    if cache is None:
+        cache = st.session_state._rollup_cache = {}
+
+    ordered_parents = cache.get(id(data))
+    if ordered_parents is None:
+        # Collect parent nodes iteratively; each parent is appended before
+        # its children, so walking the list in reverse processes children first.
+        # Only the three statement trees hold hierarchical numeric data, so
+        # start from them explicitly instead of probing every top-level
+        # section (metadata, validazioni, reclassification, ...)
+        parents = []
+        stack = []
+        for root in (data.get('conto_economico', {}),
+                     data.get('stato_patrimoniale', {}).get('attivo', {}),
+                     data.get('stato_patrimoniale', {}).get('passivo', {})):
+            stack.extend(root.values())
+
+        while stack:
+            node = stack.pop()
+            if isinstance(node, dict) and node.get('dettaglio'):
+                parents.append(node)
+                stack.extend(node['dettaglio'].values())
+
+        ordered_parents = list(reversed(parents))
+        cache[id(data)] = ordered_parents
+
+    for node in ordered_parents:
+        # Don't recalculate if enriched from NI
+        if node.get('enriched_from_ni', False):
+            continue
+
+        # Calculate sum of children (tree nodes are always dicts)
+        children_sum = sum(
+            child.get('valore', 0.0)
+            for child in node['dettaglio'].values()
+        )
+
+        # Update parent value
+        if children_sum != 0 or node.get('valore', 0.0) == 0:
+            node['valore'] = children_sum
 
 def display_financial_statements(result: Dict[str, Any], filename: str):
     """Display detailed financial statements"""
@@ -1217,161 +1435,174 @@ def display_financial_statements(result: Dict[str, Any], filename: str):
 
 def display_readonly_section(data: Dict[str, Any], section_name: str):
     """Display financial section in read-only mode"""
+    import pandas as pd
+
     flat_items = flatten_financial_data(data)
-    
+
+    # Render the whole section as one st.dataframe instead of a pair of
+    # st.columns per row: one frontend widget instead of hundreds
+    rows = []
     for item in flat_items:
-        # Create indentation based on level
-        indent_pixels = item['level'] * 20
-        name = item['voce_canonica']
-        value = item['valore']
-        
-        # Create columns for name and value
-        col1, col2 = st.columns([4, 1])
-        
-        with col1:
-            # Apply indentation using markdown
-            if indent_pixels > 0:
-                st.markdown(f'<div style="margin-left: {indent_pixels}px;">{name}</div>', unsafe_allow_html=True)
-            else:
-                if item['level'] == 0:
-                    st.markdown(f"**{name}**")
-                else:
-                    st.write(name)
-        
-        with col2:
-            # Show enrichment icon for NI items
-            enrichment_icon = '  📝' if item.get('from_ni', False) or item.get('enriched_from_ni', False) else ''
-            
-            if item['level'] == 0:
-                st.markdown(f"**{value:,.2f}{enrichment_icon}**")
-            else:
-                st.write(f"{value:,.2f}{enrichment_icon}")
+        # Indent hierarchy levels with non-breaking spaces
+        indent = ' ' * (item['level'] * 4)
+        enrichment_icon = ' 📝' if item.get('from_ni', False) or item.get('enriched_from_ni', False) else ''
+        rows.append({
+            'Item': f"{indent}{item['voce_canonica']}",
+            'Value': f"{item['valore']:,.2f}{enrichment_icon}"
+        })
+
+    st.dataframe(pd.DataFrame(rows), hide_index=True, use_container_width=True)
 
 def display_editable_section(data: Dict[str, Any], section_key: str, filename: str):
     """Display financial section in editable mode"""
+    import pandas as pd
+
     flat_items = flatten_financial_data(data)
-    
+
     # Initialize modifications dictionary for this section if not exists
     if filename not in st.session_state.user_modifications:
         st.session_state.user_modifications[filename] = {}
-    
-    changes_made = False
-    
-    for i, item in enumerate(flat_items):
-        # Create indentation based on level
-        indent_pixels = item['level'] * 20
-        name = item['voce_canonica']
-        current_value = item['valore']
-        
+
+    # Render the whole section as one st.data_editor instead of an
+    # st.number_input per row: edits are batched client-side and a single
+    # widget replaces hundreds of per-row columns
+    rows = []
+    editable_flags = []
+    for item in flat_items:
         # Check if this should be editable
         is_editable = not item['has_children'] and not item['enriched_from_ni']
-        
+
         # Special case: Credits and Debits are never editable if they have children or are enriched
-        if item['key'] in ['II - Crediti', 'D) Debiti']:
+        if item['key'] in NEVER_EDITABLE_ITEMS:
             is_editable = False
-        
-        # Create columns for name and value
-        col1, col2 = st.columns([4, 1])
-        
-        with col1:
-            # Apply indentation using markdown
-            if indent_pixels > 0:
-                st.markdown(f'<div style="margin-left: {indent_pixels}px;">{name}</div>', unsafe_allow_html=True)
-            else:
-                if item['level'] == 0:
-                    st.markdown(f"**{name}**")
-                else:
-                    st.write(name)
-        
-        with col2:
-            if is_editable:
-                # Create unique key for this input
-                input_key = f"{filename}_{section_key}_{item['key']}_{i}"
-                
-                new_value = st.number_input(
-                    "",
-                    value=float(current_value),
-                    format="%.2f",
-                    key=input_key,
-                    label_visibility="collapsed"
-                )
-                
-                # Check if value changed
-                if new_value != current_value:
-                    changes_made = True
-                    # Store the change
-                    if section_key not in st.session_state.user_modifications[filename]:
-                        st.session_state.user_modifications[filename][section_key] = {}
-                    st.session_state.user_modifications[filename][section_key][item['key']] = new_value
-                    
-                    # Trigger immediate recalculation
-                    st.rerun()
-            else:
-                # Non-editable, show as text with enrichment icon
-                enrichment_icon = ' 📝' if item.get('enriched_from_ni', False) or item.get('from_ni', False) else ''
-                
-                if item['level'] == 0:
-                    st.markdown(f"**{current_value:,.2f}{enrichment_icon}**")
-                else:
-                    st.write(f"{current_value:,.2f}{enrichment_icon}")
-    
-    if changes_made:
-        st.info("💡 Values updated! Parent totals will be recalculated automatically.")
+
+        # Indent hierarchy levels with non-breaking spaces
+        indent = ' ' * (item['level'] * 4)
+        enrichment_icon = ' 📝' if item.get('enriched_from_ni', False) or item.get('from_ni', False) else ''
+        rows.append({
+            'Item': f"{indent}{item['voce_canonica']}{enrichment_icon}",
+            'Value': float(item['valore'])
+        })
+        editable_flags.append(is_editable)
+
+    edited_df = st.data_editor(
+        pd.DataFrame(rows),
+        key=f"edit_table_{filename}_{section_key}",
+        hide_index=True,
+        use_container_width=True,
+        column_config={
+            'Item': st.column_config.TextColumn('Item', disabled=True),
+            'Value': st.column_config.NumberColumn('Value', format="%.2f", required=True)
+        }
+    )
+
+    # st.data_editor cannot lock single rows, so diff the returned frame
+    # once and only commit edits made on rows that are actually editable
+    pending_changes = []
+    for item, is_editable, new_value in zip(flat_items, editable_flags, edited_df['Value'].tolist()):
+        # A cleared cell comes back as NaN (required=True blocks committing
+        # it, but the frame still carries it mid-edit); NaN != anything, so
+        # without this guard it would be stored as a modification and keep
+        # the diff permanently dirty, rerunning forever
+        if new_value is None or not math.isfinite(new_value):
+            continue
+        if is_editable and new_value != item['valore']:
+            pending_changes.append((item['key'], new_value))
+
+    if pending_changes:
+        section_mods = st.session_state.user_modifications[filename].setdefault(section_key, {})
+        changed = False
+        for item_key, new_value in pending_changes:
+            if section_mods.get(item_key) != new_value:
+                section_mods[item_key] = new_value
+                changed = True
+
+        # Single rerun recalculates totals and BRSF for the committed edits
+        if changed:
+            st.rerun()
+
+@st.cache_resource
+def _excel_executor() -> ThreadPoolExecutor:
+    """Shared background executor for Excel serialization"""
+    return ThreadPoolExecutor(max_workers=2)
+
+def _serialize_excel(modified_result: Dict[str, Any]) -> bytes:
+    """Serialize a result to Excel bytes; safe to run off the script thread
+
+    openpyxl saves to file-like objects, so the export goes straight to
+    memory without a temp-file round-trip. Session state must not be
+    touched here: the fully applied result is passed in by the caller.
+    A fresh exporter is built per call because export() mutates instance
+    state (workbook, current row) while building sheets, so overlapping
+    background exports must not share one instance; construction is cheap
+    since the style palette lives at class level.
+    """
+    from excel_exporter import ExcelExporter
+
+    excel_buffer = BytesIO()
+    ExcelExporter().export(modified_result, excel_buffer)
+    return excel_buffer.getvalue()
 
 def generate_excel_with_modifications(result: Dict[str, Any], filename: str) -> bytes:
     """Generate Excel file with user modifications applied"""
-    # Get result with modifications applied
     modified_result = apply_user_modifications(result, filename)
-    
-    # Generate Excel using existing exporter
-    excel_buffer = BytesIO()
-    
-    # Create temporary file path
-    with tempfile.NamedTemporaryFile(suffix='.xlsx', delete=False) as tmp_file:
-        tmp_file_path = tmp_file.name
-    
-    try:
-        # Export to temporary file
-        st.session_state.exporter.export(modified_result, tmp_file_path)
-        
-        # Read the file content into memory
-        with open(tmp_file_path, 'rb') as f:
-            excel_data = f.read()
-        
-        return excel_data
-        
-    finally:
-        # Clean up temporary file
-        try:
-            Path(tmp_file_path).unlink(missing_ok=True)
-        except PermissionError:
-            import time
-            time.sleep(0.1)
-            try:
-                Path(tmp_file_path).unlink(missing_ok=True)
-            except:
-                pass
+    return _serialize_excel(modified_result)
 
 def create_action_buttons(selected_result, selected_filename):
     """Create action buttons for export and reset"""
     st.divider()
     st.markdown("### 📥 Export & Actions")
     
-    col1, col2, col3 = st.columns([2, 2, 1])
-    
+    col1, col3 = st.columns([2, 1], gap="large")
+
     with col1:
         # Download Excel button
         if selected_result:
             try:
-                excel_data = generate_excel_with_modifications(selected_result, selected_filename)
-                
-                st.download_button(
-                    label="📊 Download Excel Report",
-                    data=excel_data,
-                    file_name=f"{Path(selected_filename).stem}_financiallens.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    use_container_width=True
+                # Reruns hit this block constantly (any widget interaction),
+                # so the serialized workbook is cached on the same key as the
+                # applied modifications and only rebuilt after an actual edit
+                excel_cache = st.session_state._excel_cache
+                cache_key = _modifications_cache_key(
+                    selected_filename,
+                    st.session_state.user_modifications.get(selected_filename, {})
                 )
+                excel_data = excel_cache.get(cache_key)
+
+                if excel_data is None:
+                    futures = st.session_state._excel_futures
+                    future = futures.get(cache_key)
+
+                    if future is None:
+                        # Generation is deferred until explicitly requested,
+                        # so sessions that never download pay nothing
+                        if st.button("📊 Prepare Excel Report", use_container_width=True):
+                            # Serialize off the script thread; modifications
+                            # are applied here (cached, and session state
+                            # can't be read by workers)
+                            modified_result = apply_user_modifications(selected_result, selected_filename)
+                            futures[cache_key] = _excel_executor().submit(
+                                _serialize_excel, modified_result
+                            )
+                            st.rerun()
+                    elif future.done():
+                        excel_data = future.result()
+                        excel_cache[cache_key] = excel_data
+                        del futures[cache_key]
+                    else:
+                        # Tick until the background serialization finishes
+                        st.button("⏳ Preparing Excel Report...", disabled=True, use_container_width=True)
+                        time.sleep(0.2)
+                        st.rerun()
+
+                if excel_data is not None:
+                    st.download_button(
+                        label="📊 Download Excel Report",
+                        data=excel_data,
+                        file_name=f"{Path(selected_filename).stem}_financiallens.xlsx",
+                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                        use_container_width=True
+                    )
             except Exception as e:
                 st.error(f"Error generating Excel file: {str(e)}")
     
@@ -1392,28 +1623,43 @@ def handle_reset_confirmation():
                 # Clean up temp files first
                 cleanup_temp_files()
                 
-                # Clear session state variables
-                keys_to_reset = [
-                    'uploaded_files', 'parsing_results', 'user_modifications', 
-                    'current_tab', 'view_mode', 'brsf_scale', 'selected_document',
-                    'show_reset_confirmation', 'uploaded_files_hash'
-                ]
-                
-                for key in keys_to_reset:
-                    if key in st.session_state:
-                        del st.session_state[key]
-                
-                # Initialize fresh state
-                init_session_state()
+                # Reset everything in one update call instead of key-by-key
+                # deletes followed by re-initialization; each proxy write has
+                # its own validation/notification overhead
+                streamlit_config = APP_CONFIG.get('streamlit_settings', {})
+                st.session_state.update({
+                    'uploaded_files': [],
+                    'parsing_results': {},
+                    'user_modifications': {},
+                    'current_tab': 0,
+                    'view_mode': 'view',
+                    'brsf_scale': streamlit_config.get('brsf_scale_default'),
+                    'selected_document': None,
+                    'show_reset_confirmation': False,
+                    'uploaded_files_hash': None,
+                    '_apply_cache': {},
+                    '_flatten_cache': {},
+                    '_header_cache': {},
+                    '_rollup_cache': {},
+                    '_excel_cache': {},
+                    '_excel_futures': {},
+                    '_card_labels': {},
+                    '_brsf_cache': {}
+                })
                 
                 st.success("✅ All data has been reset successfully!")
                 time.sleep(1)
                 st.rerun()
         
         with col_no:
-            if st.button("❌ Cancel", use_container_width=True):
-                st.session_state.show_reset_confirmation = False
-                st.rerun()
+            # Clearing the flag in the click callback hides the dialog on
+            # the rerun the click already triggers, instead of paying a
+            # second full script execution via st.rerun()
+            st.button(
+                "❌ Cancel",
+                use_container_width=True,
+                on_click=lambda: st.session_state.update(show_reset_confirmation=False)
+            )
 
 def main():
     """Main application function"""
@@ -1451,12 +1697,12 @@ def main():
     # Display results if available
     if st.session_state.parsing_results:
         
-        # Get successful results
-        successful_results = {
-            filename: result for filename, result in st.session_state.parsing_results.items()
-            if result is not None
-        }
-        
+        # parsing_results only ever stores successful parses (failures are
+        # reported and dropped at upload time), so the per-rerun rebuild of
+        # a filtered copy was a no-op dict copy
+        successful_results = st.session_state.parsing_results
+
+
         if not successful_results:
             st.warning("⚠️ No financial statements were successfully processed.")
             return
@@ -1465,31 +1711,24 @@ def main():
         create_document_cards(successful_results)
         
         # Display selected document content
+        # Only the selected document is rendered per rerun; the other
+        # results stay untouched until their card is clicked, so per-rerun
+        # work does not grow with the number of uploaded files
         if st.session_state.selected_document and st.session_state.selected_document in successful_results:
             selected_filename = st.session_state.selected_document
             selected_result = successful_results[selected_filename]
             
             # Document header
-            status = get_document_status(selected_result)
-            year = get_document_year(selected_result)
-            doc_type = get_document_type(selected_result)
-            
-            # Status styling
-            if status == "SUCCESS":
-                status_class = "status-success"
-                status_icon = "✅"
-            elif status == "SUCCESS_WITH_TOLERANCE":
-                status_class = "status-warning"
-                status_icon = "⚠️"
-            else:
-                status_class = "status-error"
-                status_icon = "❌"
+            status, year, doc_type = get_document_header(selected_result)
             
+            # Status styling via table lookup
+            status_class, status_icon, status_text, _ = STATUS_STYLES.get(status, STATUS_STYLES['FAILED'])
+
             st.markdown(f"""
             <div class="custom-card">
                 <h2 style="color: var(--primary-red); margin-bottom: 1rem;">📄 {selected_filename}</h2>
                 <div style="display: flex; gap: 1rem; align-items: center; margin-bottom: 1rem;">
-                    <div class="{status_class}">{status_icon} {status.replace('_', ' ').title()}</div>
+                    <div class="{status_class}">{status_icon} {status_text}</div>
                     <div class="metric-container" style="padding: 0.5rem 1rem;">
                         <span class="metric-label">Year:</span>
                         <span class="metric-value" style="font-size: 1rem; margin-left: 0.5rem;">{year}</span>
@@ -1507,8 +1746,9 @@ def main():
             if validations:
                 summary = validations.get('summary', {})
                 if summary.get('messages'):
-                    for message in summary['messages']:
-                        st.warning(message)
+                    # One warning element for the whole block instead of a
+                    # delta element per message
+                    st.warning("  \n".join(summary['messages']))
             st.divider()
             
             # BRSF Section with its toggle
@@ -1545,7 +1785,9 @@ def main():
             create_action_buttons(selected_result, selected_filename)
         
         elif successful_results and not st.session_state.selected_document:
-            # Auto-select first document if none selected
+            # Auto-select first document if none selected; this runs once
+            # per upload batch, after which the pinned selected_document is
+            # looked up directly (no per-rerun dict scans)
             st.session_state.selected_document = next(iter(successful_results.keys()))
             st.rerun()
     
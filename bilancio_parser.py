@@ -1,7 +1,10 @@
-import pdfplumber
 import logging
+import re
+from collections import defaultdict
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from types import MappingProxyType
+from typing import BinaryIO, Dict, List, Optional, Any, Union
 
 # Import all the specialized modules
 from configuration_manager import ConfigurationManager
@@ -13,6 +16,41 @@ from data_validator import DataValidator
 from financial_reclassifier import FinancialReclassifier
 
 
+# Hot-path regexes compiled once at import: section detection runs per page
+# and value parsing per table cell
+_SECTION_PATTERNS = (
+    ('stato_patrimoniale', re.compile(r'\b(stato\s+patrimoniale)\b', re.IGNORECASE)),
+    ('conto_economico', re.compile(r'\b(conto\s+economico)\b', re.IGNORECASE))
+)
+_NUMERIC_RE = re.compile(r'^-?[\d.]+')
+
+# Detects imposte anticipate lines in abbreviated documents; the 'crediti
+# per imposte anticipate' variant is subsumed by the first alternative
+_IMPOSTE_ANTICIPATE_RE = re.compile(r'imposte anticipate|imposta anticipata')
+
+# Static portion of get_processing_statistics; wrapped in a read-only proxy
+# so the shared template cannot be mutated through a returned stats dict
+_STATIC_STATS = MappingProxyType({
+    'parser_version': 'FinancialLens Beta v1',
+    'modules_loaded': [
+        'ConfigurationManager',
+        'PDFExtractor',
+        'TextProcessor',
+        'HierarchyManager',
+        'EnrichmentEngine',
+        'DataValidator',
+        'FinancialReclassifier'
+    ],
+    'features': [
+        'Italian Financial Statement Parsing',
+        'Hierarchical Data Construction',
+        'Nota Integrativa Enrichment',
+        'Mathematical Validation',
+        'International Format Reclassification'
+    ]
+})
+
+
 class BilancioParser:
     """
     Main orchestrator for financial statement parsing with integrated reclassification.
@@ -65,11 +103,24 @@ class BilancioParser:
             self.config_manager.get_reclassifier_config()
         )
         
+        # Optional module capabilities resolved once: a single getattr here
+        # replaces repeated hasattr probes on the statistics path
+        self._get_available_contexts = getattr(
+            self.text_processor, 'get_available_contexts', None)
+        self._get_enrichment_stats = getattr(
+            self.enrichment_engine, 'get_enrichment_statistics', None)
+        self._get_reclassification_stats = getattr(
+            self.financial_reclassifier, 'get_reclassification_statistics', None)
+
         # Validate all module configurations
         if not self._validate_module_configurations():
             raise ValueError("Module configuration validation failed")
 
-    def parse(self, pdf_path: Path) -> Optional[Dict]:
+        # Memoized get_processing_statistics result; the module statistics
+        # are derived from configuration and never change after __init__
+        self._stats_cache = None
+
+    def parse(self, pdf_path: Union[Path, BinaryIO]) -> Optional[Dict]:
         """
         Parse PDF financial statement with integrated reclassification analysis.
         
@@ -84,19 +135,25 @@ class BilancioParser:
         - Output formatting
         
         Args:
-            pdf_path: Path to PDF file to parse
-            
+            pdf_path: Path to PDF file to parse, or a binary file-like
+                object (pdfplumber accepts either, so in-memory uploads
+                can skip the temp-file round-trip)
+
         Returns:
             Complete financial statement data dictionary with reclassification results
             or None if parsing fails (maintains original interface)
         """
-        file_basename = pdf_path.name
-        
+        if isinstance(pdf_path, (str, Path)):
+            file_basename = Path(pdf_path).name
+        else:
+            file_basename = getattr(pdf_path, 'name', 'in-memory PDF')
+
+        extraction_result = None
         try:
             # Step 1: Extract raw data from PDF document
             logging.info(f"Starting comprehensive financial analysis for {file_basename}")
             extraction_result = self.pdf_extractor.extract_document_data(pdf_path)
-            
+
             if not extraction_result.tables:
                 logging.error(f"No tabular data extracted from {file_basename}. Analysis terminated.")
                 return None
@@ -115,12 +172,13 @@ class BilancioParser:
             if extraction_result.is_abbreviated_format:
                 data_map = self._handle_abbreviated_imposte_anticipate(data_map)
 
-            # Step 5: Apply enrichment for abbreviated format documents
+            # Step 5: Apply enrichment for abbreviated format documents,
+            # reusing the document the extractor already opened instead of
+            # paying a second full pdfplumber parse of the same file
             if extraction_result.is_abbreviated_format:
-                with pdfplumber.open(pdf_path) as pdf:
-                    enriched_map = self.enrichment_engine.enrich_abbreviated_data(
-                        data_map, pdf, extraction_result.ni_start_page
-                    )
+                enriched_map = self.enrichment_engine.enrich_abbreviated_data(
+                    data_map, extraction_result.pdf_handle, extraction_result.ni_start_page
+                )
             else:
                 enriched_map = data_map
             
@@ -138,9 +196,9 @@ class BilancioParser:
 
                 **structured_data,
                 "testi_allegati": {
-                    section.title: section.content 
+                    section.title: section.content
                     for section in extraction_result.sections.values()
-                }
+                } if extraction_result.sections else {}
             }
 
             # Step 8: Perform mathematical validations
@@ -177,9 +235,16 @@ class BilancioParser:
             return output
             
         except Exception as e:
-            logging.error(f"Fatal error during comprehensive analysis of {pdf_path.name}: {e}", exc_info=True)
+            logging.error(f"Fatal error during comprehensive analysis of {file_basename}: {e}", exc_info=True)
             return None
 
+        finally:
+            # The extractor hands over ownership of the open document; close
+            # it whether parsing succeeded, bailed out early or raised
+            if extraction_result is not None and extraction_result.pdf_handle is not None:
+                extraction_result.pdf_handle.close()
+                extraction_result.pdf_handle = None
+
     def _perform_financial_reclassification(self, financial_data: Dict[str, Any]) -> Any:
         """
         This method orchestrates the transformation of Italian financial statement
@@ -270,12 +335,34 @@ class BilancioParser:
         flat_data: List[Dict[str, Any]] = []
         current_context: Optional[str] = None
 
+        # Invariant for the whole document; bound once instead of re-read
+        # from the extraction result on every logical line
+        is_abbreviated = extraction_result.is_abbreviated_format
+
+        # Checked once per document so the per-line debug call below doesn't
+        # format its arguments just to have the logger discard them
+        debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+
+        # Bind the per-line collaborators to locals: each dotted access in
+        # the row loop is otherwise a fresh attribute probe, and the fuzzy
+        # threshold is configuration-constant for the whole document
+        text_processor = self.text_processor
+        hierarchy_manager = self.hierarchy_manager
+        parse_value = self._parse_value
+        fuzzy_threshold = text_processor.get_fuzzy_score_threshold()
+
         # Initialize the hierarchy context, which contains the parent_stack
-        hierarchy_context = self.hierarchy_manager.create_hierarchy_context(
+        hierarchy_context = hierarchy_manager.create_hierarchy_context(
             current_context=current_context,
-            is_abbreviated_format=extraction_result.is_abbreviated_format
+            is_abbreviated_format=is_abbreviated
         )
 
+        # Index tables by page once, instead of rescanning the whole table
+        # list for every page below
+        tables_by_page = defaultdict(list)
+        for tbl in extraction_result.tables:
+            tables_by_page[tbl.page_number].append(tbl)
+
         # Process the document page by page to ensure correct context switching.
         for page_num, page_text in enumerate(extraction_result.pages_text):
             # Stop processing at the calculated boundary, which could be
@@ -294,7 +381,7 @@ class BilancioParser:
                 logging.info(f"Context changed from '{current_context}' to '{new_context}' on page {page_num + 1}.")
                 
                 # Finalize the hierarchy for the previous section.
-                self.hierarchy_manager.finalize_hierarchy_context(hierarchy_context)
+                hierarchy_manager.finalize_hierarchy_context(hierarchy_context)
                 
                 # Update the context for the new section.
                 current_context = new_context
@@ -304,8 +391,8 @@ class BilancioParser:
             if not current_context:
                 continue
 
-            # Filter to get only the tables that belong to the current page.
-            tables_on_page = [tbl for tbl in extraction_result.tables if tbl.page_number == page_num]
+            # Look up only the tables that belong to the current page.
+            tables_on_page = tables_by_page.get(page_num, ())
 
             for table_data in tables_on_page:
                 table = table_data.data
@@ -316,14 +403,18 @@ class BilancioParser:
                     continue
 
                 desc_col, val_col = layout_info['desc_col'], layout_info['value_col']
-                
+                # Constant per table; avoids a max() call per row
+                max_col = desc_col if desc_col > val_col else val_col
+
                 for row in table:
-                    if len(row) <= max(desc_col, val_col) or not row[desc_col]:
+                    if len(row) <= max_col or not row[desc_col]:
                         continue
                     
                     raw_desc = row[desc_col] or ""
-                    # A single cell can contain multiple logical lines separated by newlines.
-                    logical_lines = [line.strip() for line in raw_desc.split('\n') if line.strip()]
+                    # A single cell can contain multiple logical lines separated by
+                    # newlines. splitlines handles \r\n too, and stripping once per
+                    # line avoids the double strip of the filter-then-strip pattern.
+                    logical_lines = [s for s in (line.strip() for line in raw_desc.splitlines()) if s]
                     
                     if not logical_lines:
                         continue
@@ -331,34 +422,34 @@ class BilancioParser:
                     for i, line_desc in enumerate(logical_lines):
                         
                         # Check maturity breakdown (entro/oltre)
-                        if extraction_result.is_abbreviated_format and hierarchy_context.parent_stack:
-                            value_for_check = self._parse_value(row[val_col]) if i == len(logical_lines) - 1 else 0.0
+                        if is_abbreviated and hierarchy_context.parent_stack:
+                            value_for_check = parse_value(row[val_col]) if i == len(logical_lines) - 1 else 0.0
                             temp_item_data = {"voce_originale": line_desc, "valore": value_for_check}
-                            
-                            if self.hierarchy_manager.handle_abbreviated_scadenze(temp_item_data, hierarchy_context.parent_stack):
+
+                            if hierarchy_manager.handle_abbreviated_scadenze(temp_item_data, hierarchy_context.parent_stack):
                                 continue
                         
                         # In abbreviated format, "imposte anticipate" appears as a sub-line
                         # within "II - Crediti" but needs to be explicitly mapped
-                        if extraction_result.is_abbreviated_format:
-                            normalized_line = self.text_processor.normalize_text(line_desc, for_matching=True)
+                        if is_abbreviated:
+                            normalized_line = text_processor.normalize_text(line_desc, for_matching=True)
                             
                             # Log every line processed in abbreviated format for debugging
-                            logging.debug(f"[ABBREVIATED] Processing line: '{line_desc}' -> normalized: '{normalized_line}'")
-                            
+                            if debug_enabled:
+                                logging.debug("[ABBREVIATED] Processing line: '%s' -> normalized: '%s'", line_desc, normalized_line)
+
                             # Check for imposte anticipate patterns
-                            imposte_patterns = ['imposte anticipate', 'imposta anticipata', 'crediti per imposte anticipate']
-                            if any(pattern in normalized_line for pattern in imposte_patterns):
+                            if _IMPOSTE_ANTICIPATE_RE.search(normalized_line):
                                 # Extract value (only for last logical line in cell)
-                                valore_riga = self._parse_value(row[val_col]) if i == len(logical_lines) - 1 else 0.0
-                                
-                                logging.info(f"[ABBREVIATED]    Found imposte anticipate pattern in: '{line_desc}'")
-                                logging.info(f"[ABBREVIATED]    Value extracted: {valore_riga:,.2f} €")
+                                valore_riga = parse_value(row[val_col]) if i == len(logical_lines) - 1 else 0.0
+
+                                logging.info("[ABBREVIATED]    Found imposte anticipate pattern in: '%s'", line_desc)
+                                logging.info("[ABBREVIATED]    Value extracted: %s €", f"{valore_riga:,.2f}")
                                 
                                 if valore_riga != 0.0:
                                     # Create explicit mapping to "Crediti per imposte anticipate"
                                     imposte_item = {
-                                        "voce_originale": self.text_processor.normalize_text(line_desc),
+                                        "voce_originale": text_processor.normalize_text(line_desc),
                                         "voce_canonica": "Crediti per imposte anticipate",
                                         "valore": valore_riga,
                                         "score": 100,
@@ -390,92 +481,52 @@ class BilancioParser:
                                 else:
                                     logging.info(f"[ABBREVIATED]    Skipping: value is zero")
                         
-                        if self.text_processor.is_ignorable_text(line_desc):
+                        if text_processor.is_ignorable_text(line_desc):
                             continue
-                        
-                        # Find potential matches for the line using the correct context.
-                        candidates = self.text_processor.find_best_matches(line_desc, current_context)
 
-                        # Check for "imposte anticipate" in abbreviated format
-                        if extraction_result.is_abbreviated_format:
-                            normalized_line = self.text_processor.normalize_text(line_desc, for_matching=True)
-
-                            # Detect if this line contains "imposte anticipate"
-                            if 'imposte anticipate' in normalized_line or 'imposta anticipata' in normalized_line:
-
-                                # Extract value (only for last logical line)
-                                valore_riga = self._parse_value(row[val_col]) if i == len(logical_lines) - 1 else 0.0
-                                
-                                if valore_riga != 0.0:
-                                    # Create item for "Crediti per imposte anticipate"
-                                    imposte_item = {
-                                        "voce_originale": self.text_processor.normalize_text(line_desc),
-                                        "voce_canonica": "Crediti per imposte anticipate",
-                                        "valore": valore_riga,
-                                        "score": 100,
-                                        "contesto": current_context,
-                                        "page_num": page_num
-                                    }
-                                    
-                                    # Add to parent stack if "II - Crediti" exists
-                                    if hierarchy_context.parent_stack:
-                                        last_parent = hierarchy_context.parent_stack[-1]
-                                        if last_parent.get('voce_canonica') == 'II - Crediti':
-                                            if '_children_buffer' not in last_parent:
-                                                last_parent['_children_buffer'] = []
-                                            last_parent['_children_buffer'].append(imposte_item)
-                                    
-                                    flat_data.append(imposte_item)
-                                    
-                                    logging.info(f"  -> ABBREVIATED SYNTHETIC: Detected and mapped 'imposte anticipate' with value {valore_riga}")
-                                    continue 
-                        
-                        if self.text_processor.is_ignorable_text(line_desc):
-                            continue
-                        
                         # Find potential matches for the line using the correct context.
-                        candidates = self.text_processor.find_best_matches(line_desc, current_context)
+                        candidates = text_processor.find_best_matches(line_desc, current_context)
                         if not candidates:
                             continue
-                        
+
                         # Disambiguate candidates using the current hierarchical context.
-                        disambiguation_context = self.text_processor.create_disambiguation_context(
+                        disambiguation_context = text_processor.create_disambiguation_context(
                             hierarchy_context.parent_stack
                         )
-                        match_voce, score = self.text_processor.disambiguate_candidates(
+                        match_voce, score = text_processor.disambiguate_candidates(
                             candidates, disambiguation_context
                         )
-                        
-                        if score < self.text_processor.get_fuzzy_score_threshold():
+
+                        if score < fuzzy_threshold:
                             continue
-                        
+
                         # Extract the value (only for the last logical line in a multi-line description).
-                        valore_riga = self._parse_value(row[val_col]) if i == len(logical_lines) - 1 else 0.0
-                        
-                        config_node = self.hierarchy_manager._get_config_node(match_voce)
+                        valore_riga = parse_value(row[val_col]) if i == len(logical_lines) - 1 else 0.0
+
+                        config_node = hierarchy_manager._get_config_node(match_voce)
                         is_potential_parent = config_node and 'dettaglio' in config_node
 
                         valore_da_assegnare = 0.0 if is_potential_parent and valore_riga == 0.0 else valore_riga
 
                         item_data = {
-                            "voce_originale": self.text_processor.normalize_text(line_desc),
+                            "voce_originale": text_processor.normalize_text(line_desc),
                             "voce_canonica": match_voce,
                             "valore": valore_da_assegnare,
                             "score": score,
                             "contesto": current_context,
                             "page_num": page_num
                         }
-                        
+
                         # Process the item through the hierarchy manager to update the parent stack.
-                        hierarchy_context = self.hierarchy_manager.process_financial_item(
+                        hierarchy_context = hierarchy_manager.process_financial_item(
                             item_data, hierarchy_context
                         )
-                        
+
                         flat_data.append(item_data)
-        
+
         # Finalize the hierarchy for the last processed section.
-        self.hierarchy_manager.finalize_hierarchy_context(hierarchy_context)
-        
+        hierarchy_manager.finalize_hierarchy_context(hierarchy_context)
+
         return flat_data
 
     def _detect_section_context(self, page_text: str) -> Optional[str]:
@@ -488,17 +539,10 @@ class BilancioParser:
         Returns:
             Section name or None if not detected
         """
-        import re
-        
-        section_patterns = {
-            'stato_patrimoniale': re.compile(r'\b(stato\s+patrimoniale)\b', re.IGNORECASE),
-            'conto_economico': re.compile(r'\b(conto\s+economico)\b', re.IGNORECASE)
-        }
-        
-        for section_name, pattern in section_patterns.items():
+        for section_name, pattern in _SECTION_PATTERNS:
             if pattern.search(page_text):
                 return section_name
-        
+
         return None
 
     def _build_data_map(self, flat_data: List[Dict[str, Any]]) -> Dict[str, Dict]:
@@ -512,19 +556,19 @@ class BilancioParser:
             Dictionary mapping canonical names to item data
         """
         data_map: Dict[str, Dict] = {}
-        
+
         for item in flat_data:
-            key = item['voce_canonica']
-            
             # Clean up temporary hierarchy data
-            if '_children_buffer' in item:
-                del item['_children_buffer']
-            
+            item.pop('_children_buffer', None)
+
             # Use new item if not exists, or if new item has non-zero value and existing has zero
-            if (key not in data_map or 
-                (item.get('valore', 0.0) != 0.0 and data_map[key].get('valore') == 0.0)):
+            key = item['voce_canonica']
+            existing = data_map.get(key)
+            if existing is None:
                 data_map[key] = item
-        
+            elif item.get('valore', 0.0) != 0.0 and existing.get('valore') == 0.0:
+                data_map[key] = item
+
         return data_map
 
     def _build_final_structure(self, data_map: Dict[str, Dict]) -> Dict[str, Any]:
@@ -573,13 +617,19 @@ class BilancioParser:
         
         return structured_data
 
-    def _parse_value(self, value_str: Optional[str]) -> float:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _parse_value(value_str: Optional[str]) -> float:
         """
         Parse value string to float exactly as original parser.
-        
+
+        A static method with a bounded memo: the row loop parses the same
+        cell strings repeatedly (zeros, dashes, values recurring across
+        pages and retry attempts), and the result depends only on the input.
+
         Args:
             value_str: String value to parse
-            
+
         Returns:
             Parsed float value or 0.0 if parsing fails
         """
@@ -590,8 +640,7 @@ class BilancioParser:
         if clean_str.startswith('(') and clean_str.endswith(')'):
             clean_str = '-' + clean_str[1:-1]
         
-        import re
-        numeric_part = re.search(r'^-?[\d.]+', clean_str)
+        numeric_part = _NUMERIC_RE.search(clean_str)
         if not numeric_part:
             return 0.0
         
@@ -617,8 +666,9 @@ class BilancioParser:
         ]
         
         for module_name, module_instance in modules_to_validate:
-            if hasattr(module_instance, 'validate_configuration'):
-                if not module_instance.validate_configuration():
+            validate = getattr(module_instance, 'validate_configuration', None)
+            if validate is not None:
+                if not validate():
                     logging.error(f"{module_name} configuration validation failed")
                     return False
         
@@ -629,40 +679,29 @@ class BilancioParser:
         Get statistics about the parser configuration and capabilities.
         
         Provides information about the parser setup for monitoring purposes.
-        
+        The result is built once and memoized: everything in it is derived
+        from configuration loaded at construction time, so repeated callers
+        (status panels, logging) share the same dictionary.
+
         Returns:
             Dictionary containing parser statistics and configuration info
         """
-        stats = {
-            'parser_version': 'FinancialLens Beta v1',
-            'modules_loaded': [
-                'ConfigurationManager',
-                'PDFExtractor', 
-                'TextProcessor',
-                'HierarchyManager',
-                'EnrichmentEngine',
-                'DataValidator',
-                'FinancialReclassifier' 
-            ],
-            'features': [
-                'Italian Financial Statement Parsing',
-                'Hierarchical Data Construction',
-                'Nota Integrativa Enrichment',
-                'Mathematical Validation',
-                'International Format Reclassification'
-            ]
-        }
-        
+        if self._stats_cache is not None:
+            return self._stats_cache
+
+        stats = dict(_STATIC_STATS)
+
         # Add module-specific statistics if available
-        if hasattr(self.text_processor, 'get_available_contexts'):
-            stats['available_contexts'] = self.text_processor.get_available_contexts()
-        
-        if hasattr(self.enrichment_engine, 'get_enrichment_statistics'):
-            stats['enrichment_stats'] = self.enrichment_engine.get_enrichment_statistics()
-        
-        if hasattr(self.financial_reclassifier, 'get_reclassification_statistics'):
-            stats['reclassification_stats'] = self.financial_reclassifier.get_reclassification_statistics()
-        
+        if self._get_available_contexts is not None:
+            stats['available_contexts'] = self._get_available_contexts()
+
+        if self._get_enrichment_stats is not None:
+            stats['enrichment_stats'] = self._get_enrichment_stats()
+
+        if self._get_reclassification_stats is not None:
+            stats['reclassification_stats'] = self._get_reclassification_stats()
+
+        self._stats_cache = stats
         return stats
 
     def _handle_abbreviated_imposte_anticipate(self, data_map: Dict[str, Dict]) -> Dict[str, Dict]:
@@ -12,26 +12,44 @@ class ProfessionalExcelExporter:
     Excel exporter for financial statement analysis
     """
 
+    # Style palette shared by all exporter instances; NamedStyle objects
+    # are immutable in practice and openpyxl registers them per workbook
+    # on first use, so building them once is enough
+    _shared_color_scheme: Optional[Dict[str, str]] = None
+    _shared_styles: Optional[Dict[str, Any]] = None
+
     def __init__(self):
         """Initialize the Excel exporter."""
-        self.color_scheme = self._setup_refined_colors()
-        self.styles = self._setup_professional_styles()
+        cls = ProfessionalExcelExporter
+        if cls._shared_styles is None:
+            self.color_scheme = self._setup_refined_colors()
+            cls._shared_color_scheme = self.color_scheme
+            cls._shared_styles = self._setup_professional_styles()
+        self.color_scheme = cls._shared_color_scheme
+        self.styles = cls._shared_styles
         self.workbook = None
         self.current_row = 1
 
-    def export(self, data: Dict[str, Any], excel_output_path: str, 
+    def export(self, data: Dict[str, Any], excel_output_path,
                reclassification_result: Optional[Dict[str, Any]] = None) -> None:
         """
         Export financial statement data to a formatted Excel workbook.
-        
+
         Args:
             data: Complete financial statement data dictionary
-            excel_output_path: Path where the Excel file should be saved
+            excel_output_path: Path or writable binary file-like object
+                where the Excel workbook should be saved
             reclassification_result: Optional reclassification analysis results
         """
         # Extract reclassification data from main data if not provided separately
         if reclassification_result is None:
             reclassification_result = data.get('reclassification', {})
+
+        # A regular openpyxl workbook (not write_only, not another
+        # backend) is deliberate: the sheet builders rely on coordinate
+        # access, merged cells and shared NamedStyles, none of which a
+        # row-streaming writer supports, and the report tops out at a few
+        # hundred styled cells per sheet
         self.workbook = Workbook()
         
         # Remove default sheet
@@ -49,9 +67,10 @@ class ProfessionalExcelExporter:
         if self.workbook.worksheets:
             self.workbook.active = self.workbook.worksheets[0]
         
-        # Save the workbook
+        # Save the workbook (openpyxl accepts both paths and streams)
         self.workbook.save(excel_output_path)
-        print(f"Excel report created successfully: {excel_output_path}")
+        if isinstance(excel_output_path, str):
+            print(f"Excel report created successfully: {excel_output_path}")
 
     def _setup_refined_colors(self) -> Dict[str, str]:
         """
@@ -6,6 +6,10 @@ from dataclasses import dataclass, field
 @dataclass
 class HierarchyContext:
     """Context for hierarchy building during financial statement processing."""
+    # Slots keep instances compact and make attribute access a fixed-offset
+    # load; this object is read on every logical line of the row loop
+    __slots__ = ('current_context', 'parent_stack', 'is_abbreviated_format')
+
     current_context: Optional[str]
     parent_stack: List[Dict[str, Any]]
     is_abbreviated_format: bool
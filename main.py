@@ -2,9 +2,11 @@ import re
 import os
 import json
 import logging
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
 from tqdm import tqdm
 from bilancio_parser import BilancioParser
+from configuration_manager import ConfigurationManager
 from excel_exporter import ExcelExporter
 
 
@@ -25,13 +27,77 @@ def setup_logging():
     )
 
 
+# One parser per worker process, built by the pool initializer so the
+# configuration (YAML files, fuzzy vocabulary, reclassification mapping)
+# is loaded once per worker instead of once per task
+_worker_parser = None
+
+
+def _init_worker(config_path: Path):
+    """Initialize logging and a reusable parser in a pool worker process."""
+    global _worker_parser
+    setup_logging()
+    _worker_parser = BilancioParser(config_path)
+
+
+def _parse_with_retry(pdf_path: Path) -> dict:
+    """
+    Parse a single PDF inside a worker process, with retry logic.
+
+    The parser sometimes produces non-deterministic results due to
+    ambiguities in fuzzy matching. While awaiting a definitive fix in the
+    core parser logic, we implement a retry system. If parsing fails or
+    succeeds with tolerance, it's retried up to 3 times. If one attempt
+    achieves full success, that result is used. Otherwise, the first
+    attempt result is returned.
+    """
+    logging.info(f"--- Starting processing of: {pdf_path.name} ---")
+
+    first_attempt_result = None
+    final_result = None
+    max_attempts = 3
+
+    for attempt in range(max_attempts):
+        logging.info(f"Attempt {attempt + 1} of {max_attempts} for '{pdf_path.name}'...")
+
+        # Reuse the same parser instance instead of recreating
+        # This eliminates redundant configuration loading and improves performance
+        current_result = _worker_parser.parse(pdf_path)
+
+        if attempt == 0:
+            first_attempt_result = current_result  # Always save first result
+
+        if not current_result:  # Critical parsing failure
+            logging.warning(f"Attempt {attempt + 1} failed (critical error).")
+            continue
+
+        validation_status = current_result.get('validazioni', {}).get('summary', {}).get('status', 'failed')
+
+        if validation_status == 'success':
+            logging.info(f"✅ Attempt {attempt + 1} succeeded with full success!")
+            final_result = current_result
+            break  # Exit loop if correct result found
+        else:
+            logging.warning(f"Attempt {attempt + 1} completed with status: {validation_status.upper()}. Will retry if possible.")
+
+    # Use first attempt result if no perfect result was achieved
+    if final_result is None:
+        logging.warning(f"No attempt achieved full success. Using first attempt result.")
+        final_result = first_attempt_result
+
+    return final_result
+
+
 def process_pdfs_in_folder(folder_path: Path, output_folder: Path, config_path: Path):
     """
     Process all PDF files in a folder.
-    
-    The retry mechanism handles non-deterministic behavior in fuzzy matching by
+
+    Parsing is CPU-bound (PDF layout analysis plus fuzzy matching), so the
+    files are dispatched to a process pool with one parser per worker;
+    Excel export stays in the parent process as results arrive. The retry
+    mechanism handles non-deterministic behavior in fuzzy matching by
     attempting parsing up to 3 times and using the best result.
-    
+
     Args:
         folder_path: Directory containing PDF files to process
         output_folder: Directory for output files
@@ -40,105 +106,87 @@ def process_pdfs_in_folder(folder_path: Path, output_folder: Path, config_path:
     if not output_folder.exists():
         output_folder.mkdir(parents=True)
 
-    # Initialize parser and exporter once and reuse them
-    # This prevents redundant configuration loading on every retry attempt
-    parser = BilancioParser(config_path)
+    # The parent only needs the output settings, not a full parser
+    output_settings = ConfigurationManager(config_path).get_output_settings()
     exporter = ExcelExporter()
-    
+
     # Find all PDF files to process
     pdf_files = list(folder_path.glob('*.pdf'))
-    
+
     if not pdf_files:
         logging.warning(f"No PDF files found in folder '{folder_path}'.")
         return
 
     logging.info(f"Found {len(pdf_files)} PDF files to process.")
 
-    # Process each PDF file with retry logic
-    for pdf_path in tqdm(pdf_files, desc="Processing Financial Statements"):
-        logging.info(f"--- Starting processing of: {pdf_path.name} ---")
-        
-        # The parser sometimes produces non-deterministic results due to
-        # ambiguities in fuzzy matching. While awaiting a definitive fix in the
-        # core parser logic, we implement a retry system. If parsing fails or
-        # succeeds with tolerance, it's retried up to 3 times. If one attempt
-        # achieves full success, that result is used. Otherwise, the first
-        # attempt result is saved.
-        
-        first_attempt_result = None
-        final_result = None
-        max_attempts = 3
-
-        for attempt in range(max_attempts):
-            logging.info(f"Attempt {attempt + 1} of {max_attempts} for '{pdf_path.name}'...")
-            
-            # Reuse the same parser instance instead of recreating
-            # This eliminates redundant configuration loading and improves performance
-            current_result = parser.parse(pdf_path)
-
-            if attempt == 0:
-                first_attempt_result = current_result  # Always save first result
-
-            if not current_result:  # Critical parsing failure
-                logging.warning(f"Attempt {attempt + 1} failed (critical error).")
-                continue
-
-            validation_status = current_result.get('validazioni', {}).get('summary', {}).get('status', 'failed')
-            
-            if validation_status == 'success':
-                logging.info(f"✅ Attempt {attempt + 1} succeeded with full success!")
-                final_result = current_result
-                break  # Exit loop if correct result found
-            else:
-                logging.warning(f"Attempt {attempt + 1} completed with status: {validation_status.upper()}. Will retry if possible.")
-
-        # Use first attempt result if no perfect result was achieved
-        if final_result is None:
-            logging.warning(f"No attempt achieved full success. Using first attempt result.")
-            final_result = first_attempt_result
-
-        if final_result:
-            # Get output settings from parser configuration
-            output_settings = parser.config_manager.get_output_settings()
-            prefixes = output_settings.get('output_prefixes', {})
-
-            # Determine file prefix based on COMBINED validation status (Parser + Reclassification)
-            prefix = prefixes.get('success', '')
-
-            # Get parser validation status
-            parser_status = final_result.get('validazioni', {}).get('summary', {}).get('status', 'success')
-
-            # Get reclassification validation status
-            reclassification_data = final_result.get('reclassification', {})
-            reclassify_status = 'success'  # Default if reclassification not available
-
-            if reclassification_data.get('success', False):
-                # Check reclassification balance sheet validation
-                balance_validation = reclassification_data.get('balance_sheet_validation', {})
-                reclassify_status = balance_validation.get('status', 'success')
-            elif reclassification_data.get('success') is False:
-                reclassify_status = 'failed'
-
-            # Combine statuses for final determination
-            if parser_status == 'failed' or reclassify_status == 'failed':
-                prefix = prefixes.get('failed', '')
-            elif parser_status == 'success_with_tolerance' or reclassify_status == 'success_with_tolerance':
-                prefix = prefixes.get('success_with_tolerance', '')
-            # else: success + success = prefix already set above
-
-            # Define output file paths with combined status naming
-            base_filename = f"{prefix}{pdf_path.stem}"
-            excel_output_path = output_folder / f"{base_filename}.xlsx"
+    max_workers = min(len(pdf_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(config_path,)
+    ) as executor, tqdm(total=len(pdf_files), desc="Processing Financial Statements") as progress:
+        futures = {
+            executor.submit(_parse_with_retry, pdf_path): pdf_path
+            for pdf_path in pdf_files
+        }
+
+        for future in as_completed(futures):
+            pdf_path = futures[future]
 
             try:
-                # Generate Excel file using updated exporter
-                exporter.export(final_result, str(excel_output_path))
-                
-                # Log combined status
-                combined_status = 'SUCCESS' if not prefix else ('SUCCESS_WITH_TOLERANCE' if 'SuccessWithTol' in prefix else 'FAILED')
-                logging.info(f"✅ Results for '{pdf_path.name}' (Parser: {parser_status.upper()}, Reclassify: {reclassify_status.upper()}, Final: {combined_status}) saved in Excel.\n")
+                final_result = future.result()
             except Exception as e:
-                logging.error(f"❌ Unable to save output files for '{pdf_path.name}': {e}")
+                logging.error(f"❌ Unexpected error while processing '{pdf_path.name}': {e}")
+                final_result = None
+
+            _export_result(final_result, pdf_path, output_folder, output_settings, exporter)
+            progress.update(1)
+
+
+def _export_result(final_result, pdf_path: Path, output_folder: Path, output_settings: dict, exporter: ExcelExporter):
+    """Write the Excel output for one parsed PDF with status-based naming."""
+    if not final_result:
+        return
+
+    prefixes = output_settings.get('output_prefixes', {})
+
+    # Determine file prefix based on COMBINED validation status (Parser + Reclassification)
+    prefix = prefixes.get('success', '')
+
+    # Get parser validation status
+    parser_status = final_result.get('validazioni', {}).get('summary', {}).get('status', 'success')
+
+    # Get reclassification validation status
+    reclassification_data = final_result.get('reclassification', {})
+    reclassify_status = 'success'  # Default if reclassification not available
+
+    if reclassification_data.get('success', False):
+        # Check reclassification balance sheet validation
+        balance_validation = reclassification_data.get('balance_sheet_validation', {})
+        reclassify_status = balance_validation.get('status', 'success')
+    elif reclassification_data.get('success') is False:
+        reclassify_status = 'failed'
+
+    # Combine statuses for final determination
+    if parser_status == 'failed' or reclassify_status == 'failed':
+        prefix = prefixes.get('failed', '')
+    elif parser_status == 'success_with_tolerance' or reclassify_status == 'success_with_tolerance':
+        prefix = prefixes.get('success_with_tolerance', '')
+    # else: success + success = prefix already set above
+
+    # Define output file paths with combined status naming
+    base_filename = f"{prefix}{pdf_path.stem}"
+    excel_output_path = output_folder / f"{base_filename}.xlsx"
+
+    try:
+        # Generate Excel file using updated exporter
+        exporter.export(final_result, str(excel_output_path))
+
+        # Log combined status
+        combined_status = 'SUCCESS' if not prefix else ('SUCCESS_WITH_TOLERANCE' if 'SuccessWithTol' in prefix else 'FAILED')
+        logging.info(f"✅ Results for '{pdf_path.name}' (Parser: {parser_status.upper()}, Reclassify: {reclassify_status.upper()}, Final: {combined_status}) saved in Excel.\n")
+    except Exception as e:
+        logging.error(f"❌ Unable to save output files for '{pdf_path.name}': {e}")
 
 def main():
     """    
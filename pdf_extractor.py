@@ -1,7 +1,7 @@
 import pdfplumber
 import re
 import logging
-from typing import Dict, List, Optional, Tuple, Any
+from typing import BinaryIO, Dict, List, Optional, Tuple, Any, Union
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -39,6 +39,11 @@ class PDFExtractionResult:
     # from where to START enrichment (ni_start_page).
     parsing_boundary_page: int
 
+    # The still-open pdfplumber document, so downstream steps (Nota
+    # Integrativa enrichment) can reuse it instead of re-parsing the file.
+    # Ownership passes to the caller, which must close it when done.
+    pdf_handle: Optional[pdfplumber.PDF] = None
+
 
 class PDFExtractor:
     """
@@ -93,39 +98,47 @@ class PDFExtractor:
             'rendiconto finanziario'
         ]
 
-    def extract_document_data(self, pdf_path: Path) -> PDFExtractionResult:
+    def extract_document_data(self, pdf_path: Union[Path, BinaryIO]) -> PDFExtractionResult:
         """
         Extract all relevant data from PDF document.
         ...
         """
+        # The document stays open and is handed to the caller through the
+        # result, so the enrichment step can reuse it instead of paying a
+        # second full pdfplumber open on the same file
+        pdf = None
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                # Extract sections and determine BOTH boundaries
-                sections, ni_start_page, boundary_page = self._extract_sections(pdf)
-                
-                full_text_list = [p.extract_text(x_tolerance=1) or "" for p in pdf.pages]
-                full_text_normalized = ' '.join(full_text_list).lower().replace('\n', ' ')
-                is_abbreviated = self._detect_abbreviated_format(full_text_normalized)
-                is_consolidated = self._detect_consolidated_format(full_text_normalized)
+            pdf = pdfplumber.open(pdf_path)
+
+            # Extract sections and determine BOTH boundaries
+            sections, ni_start_page, boundary_page = self._extract_sections(pdf)
+
+            full_text_list = [p.extract_text(x_tolerance=1) or "" for p in pdf.pages]
+            full_text_normalized = ' '.join(full_text_list).lower().replace('\n', ' ')
+            is_abbreviated = self._detect_abbreviated_format(full_text_normalized)
+            is_consolidated = self._detect_consolidated_format(full_text_normalized)
+
+            # Extract tables with context until the boundary
+            tables = self._extract_tables_with_context(pdf, boundary_page)
+
+            document_year = self._determine_document_year(tables, full_text_list)
+
+            return PDFExtractionResult(
+                pages_text=full_text_list,
+                tables=tables,
+                sections=sections,
+                document_year=document_year,
+                is_abbreviated_format=is_abbreviated,
+                is_consolidated_format=is_consolidated,
+                ni_start_page=ni_start_page,
+                parsing_boundary_page=boundary_page, # Pass the new boundary page
+                pdf_handle=pdf
+            )
 
-                # Extract tables with context until the boundary
-                tables = self._extract_tables_with_context(pdf, boundary_page)
-                
-                document_year = self._determine_document_year(tables, full_text_list)
-                
-                return PDFExtractionResult(
-                    pages_text=full_text_list,
-                    tables=tables,
-                    sections=sections,
-                    document_year=document_year,
-                    is_abbreviated_format=is_abbreviated,
-                    is_consolidated_format=is_consolidated,
-                    ni_start_page=ni_start_page,
-                    parsing_boundary_page=boundary_page # Pass the new boundary page
-                )
-                
         except Exception as e:
-            logging.error(f"Failed to extract data from PDF {pdf_path.name}: {e}")
+            if pdf is not None:
+                pdf.close()
+            logging.error(f"Failed to extract data from PDF {getattr(pdf_path, 'name', pdf_path)}: {e}")
             raise
 
     def _extract_sections(self, pdf: pdfplumber.PDF) -> Tuple[Dict[str, SectionInfo], int, int]:
@@ -61,6 +61,20 @@ class TextProcessor:
         # Processed ignore patterns
         self.ignore_patterns = config.get('ignore_patterns', [])
 
+        # Bounded memo for normalize_text: the row loop normalizes the same
+        # cell text repeatedly (once for matching, once for storage, and
+        # again across retry attempts), so repeats become a dict lookup
+        self._norm_cache: Dict[Tuple[str, bool], str] = {}
+        self._norm_cache_max_size = 4096
+
+        # Bounded memo for find_best_matches: common labels ('Totale
+        # attivo', maturity lines, headers) recur across pages and retry
+        # attempts, and process.extract re-scores the whole synonym
+        # vocabulary each time. Cached lists are shared; callers never
+        # mutate the candidates
+        self._match_cache: Dict[Tuple[str, str], List['MatchCandidate']] = {}
+        self._match_cache_max_size = 1024
+
     def normalize_text(self, text: Any, for_matching: bool = False) -> str:
         """
         Normalize text
@@ -83,20 +97,37 @@ class TextProcessor:
         """
         if not text:
             return ""
-        
+
+        # Only plain strings go through the memo; other types are rare and
+        # not reliably hashable
+        cache_key = (text, for_matching) if isinstance(text, str) else None
+        if cache_key is not None:
+            cached = self._norm_cache.get(cache_key)
+            if cached is not None:
+                return cached
+
         # Convert to string and apply basic cleanup exactly as original
         text_str = str(text).strip().lower()
-        
+
         # Replace tabs and carriage returns with spaces
         text_str = re.sub(r'[\t\r]', ' ', text_str)
-        
+
         if for_matching:
             # Additional normalization for fuzzy matching
             text_str = text_str.replace('\n', ' ')
             text_str = re.sub(r'[^a-z0-9\s]', '', text_str)
-        
+
         # Final cleanup: normalize multiple spaces to single space
-        return re.sub(r'\s+', ' ', text_str.strip())
+        normalized = re.sub(r'\s+', ' ', text_str.strip())
+
+        if cache_key is not None:
+            # Evict the oldest entry once the bound is hit (dicts preserve
+            # insertion order, so the first key is the oldest)
+            if len(self._norm_cache) >= self._norm_cache_max_size:
+                del self._norm_cache[next(iter(self._norm_cache))]
+            self._norm_cache[cache_key] = normalized
+
+        return normalized
 
     def find_best_matches(self, text: str, context: str) -> List[MatchCandidate]:
         """
@@ -117,10 +148,15 @@ class TextProcessor:
         # Normalize input text for matching exactly as original
         norm_text = self.normalize_text(text, for_matching=True)
         context_map = self.inverted_configs.get(context, {})
-        
+
         if not norm_text or not context_map:
             return []
-        
+
+        cache_key = (norm_text, context)
+        cached = self._match_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Find best matching synonyms using exact same fuzzy algorithm
         best_matching_synonyms = process.extract(norm_text, context_map.keys(), limit=5)
         
@@ -146,8 +182,15 @@ class TextProcessor:
             key = candidate.canonical_name
             if key not in unique_candidates or candidate.score > unique_candidates[key].score:
                 unique_candidates[key] = candidate
-        
-        return sorted(unique_candidates.values(), key=lambda x: x.score, reverse=True)
+
+        result = sorted(unique_candidates.values(), key=lambda x: x.score, reverse=True)
+
+        # Same insertion-order eviction as the normalization memo
+        if len(self._match_cache) >= self._match_cache_max_size:
+            del self._match_cache[next(iter(self._match_cache))]
+        self._match_cache[cache_key] = result
+
+        return result
 
     def disambiguate_candidates(self, candidates: List[MatchCandidate], 
                                context: DisambiguationContext) -> Tuple[str, int]: